@@ -0,0 +1,102 @@
+# Response schema for featurefit.py (Structured Outputs; field aliases keep the display keys).
+# Streamlit re-executes the entry script on every rerun, but an imported module is built
+# once per process, so the models and the strict JSON schema live here.
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class _Schema(BaseModel):
+    # Structured Outputs requires every object to be closed and fully required.
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+
+class RiceComponent(_Schema):
+    value: int
+    reason: str
+
+class RiceScores(_Schema):
+    Reach: RiceComponent
+    Impact: RiceComponent
+    Confidence: RiceComponent
+    Effort: RiceComponent
+    final_rice_score: float
+
+class MoscowPriority(_Schema):
+    category: str
+    justification: str
+
+class Risks(_Schema):
+    technical_complexity: str
+    business_model: str
+    adoption: str
+    competition: str
+
+class SwotAnalysis(_Schema):
+    Strengths: str
+    Weaknesses: str
+    Opportunities: str
+    Threats: str
+
+class Implementation(_Schema):
+    complexity: str
+    dependencies: str
+    timeline: str
+
+class RoadmapPhase(_Schema):
+    Phase: str
+    Timeline: str
+    Milestone: str
+    success_metric: str = Field(alias="Success Metric")
+
+class BusinessValue(_Schema):
+    revenue_potential: str
+    cost_savings: str
+    market_positioning: str
+
+class ConfidenceImprovementAreas(_Schema):
+    market_understanding: str = Field(alias="Market Understanding")
+    technical_feasibility: str = Field(alias="Technical Feasibility")
+    business_impact: str = Field(alias="Business Impact")
+    implementation_clarity: str = Field(alias="Implementation Clarity")
+
+class ScoresSection(_Schema):
+    rice_scores: RiceScores
+    moscow_priority: MoscowPriority
+
+class RisksSection(_Schema):
+    risks: Risks
+    swot_analysis: SwotAnalysis
+
+class RoadmapSection(_Schema):
+    implementation: Implementation
+    mvp_recommendation: str
+    roadmap: list[RoadmapPhase]
+
+class MonetizationSection(_Schema):
+    business_value: BusinessValue
+    industry_specific_considerations: str
+    recommended_monetization: str
+
+class ClarifyingSection(_Schema):
+    overall_confidence: float
+    confidence_improvement_areas: ConfidenceImprovementAreas
+    assumption_line: str
+    clarifying_questions: list[str]
+
+# Bases are listed in reverse so the fields come out scores-first, as in the sections.
+class Analysis(ClarifyingSection, MonetizationSection, RoadmapSection, RisksSection, ScoresSection):
+    pass
+
+# Each section is requested separately (and concurrently) in live mode; the
+# single-call Analysis model used by the fan-out and Batch API combines them.
+# name -> (scope description, response model)
+ANALYSIS_SECTIONS = {
+    "scores": ("the RICE scores and MoSCoW priority", ScoresSection),
+    "risks": ("the risk assessment and SWOT analysis", RisksSection),
+    "roadmap": ("the implementation plan, MVP recommendation and roadmap", RoadmapSection),
+    "monetization": ("the business value, monetization and industry considerations", MonetizationSection),
+    "clarifying": ("the overall confidence, assumptions and clarifying questions", ClarifyingSection),
+}
+# The Batch API takes raw request bodies, so it gets the schema as a plain dict.
+ANALYSIS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "analysis", "strict": True, "schema": Analysis.model_json_schema()}
+}
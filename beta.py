@@ -1,150 +1,508 @@
+import asyncio
+import io
 import logging
 import os
-import json
+import re
+import hashlib
+import sqlite3
+import time
+from bisect import bisect_right
+from contextlib import closing
+from html import escape
+from logging.handlers import RotatingFileHandler
+from typing import Union
 from textwrap import dedent
 
 import streamlit as st
 from dotenv import load_dotenv
-import openai
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from pydantic import ConfigDict, Field, ValidationError, field_validator
+from tenacity import before_sleep_log, retry, retry_if_exception, stop_after_attempt
 
-# Configure logging
-logging.basicConfig(
-    filename='app.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+import analysis_schema
+from retry_policy import jittered_backoff
 
-load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY", "")
-logger.info("Application started in multi-call mode")
+try:
+    import orjson
 
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode("utf-8")
 
-###############################################################################
-# GPT ANALYSIS
-###############################################################################
-def generate_visual_analysis(feature_data: dict) -> dict:
-    """
-    Temperature is kept low (0.1) to limit variability and produce more logical,
-    stable data. Everything else remains the same.
+    _loads = orjson.loads
+except ImportError:  # orjson is in requirements.txt; stdlib keeps the app usable without it
+    import json
 
-    Creates a ChatCompletion call to GPT-4, 
-    returning a JSON structure with RICE scores, clarifying_questions, etc.
-    """
-    system_message = dedent("""
-        You are an experienced product management assistant specializing in feature analysis.
-        Your role is to provide comprehensive, realistic, and data-driven analysis of product features.
-        You must be conservative in scoring and provide detailed justifications for all assessments.
-        Provide clarifying questions if you need more information from the user.
-    """)
+    def _dumps(obj) -> str:
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
-    custom_instructions = dedent("""
-        Please provide a realistic confidence score on a 0-10 scale:
-        - 0-3 if the user input is nonsense or severely incomplete,
-        - 4-6 if there's partial or questionable data,
-        - 7-8 if the data is decent or typical,
-        - 9-10 if the input is extremely thorough with no ambiguities.
+    _loads = json.loads
 
-        Return valid JSON only with no extra text or formatting.
-    """)
+# Configure logging
+# Its own beta.log (same 1 MB x 3 rotation as featurefit.py), so the two apps never roll
+# over the same file; set up only on the first run of the process, as reruns share the root logger.
+logger = logging.getLogger(__name__)
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        handlers=[RotatingFileHandler('beta.log', maxBytes=1_000_000, backupCount=3)],
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    logger.info("Application started in multi-call mode")
 
-    prompt = dedent(f"""
-    {custom_instructions}
+GPT_MODEL = os.getenv("FEATUREFIT_MODEL", "gpt-4o-mini")
+GPT_TEMPERATURE = 0.1
+GPT_MAX_TOKENS = 1800  # headroom over the full analysis schema (~1.2k tokens)
+# Comma-separated models to fan out to on re-analysis, e.g. "gpt-4o-mini,gpt-4o".
+GPT_COMPARE_MODELS = [m.strip() for m in os.getenv("FEATUREFIT_COMPARE_MODELS", "").split(",") if m.strip()]
+ANALYSIS_CACHE_TTL = 3600  # seconds an analysis stays in memory after it was last loaded
+ANALYSIS_DISK_TTL = 7 * 24 * 3600  # seconds it stays in the SQLite cache, across restarts
+ANALYSIS_CACHE_MAX_ENTRIES = 128  # in-memory analyses kept per process
+ANALYSIS_CACHE_DB = ".featurefit_cache.sqlite3"
+
+# Matches the (possibly still growing) assumption_line string in a partial JSON stream;
+# only complete escape sequences are consumed.
+_PARTIAL_ASSUMPTION_RE = re.compile(r'"assumption_line"\s*:\s*"((?:[^"\\]|\\.)*)')
+# A number only counts once a delimiter follows it, so it is never half-read.
+_PARTIAL_CONFIDENCE_RE = re.compile(r'"overall_confidence"\s*:\s*(-?\d+(?:\.\d+)?)\s*[,}]')
 
-    Analyze the following feature and provide a comprehensive evaluation in valid JSON. 
-    The user does NOT want to display raw JSON on screen, only final visuals. 
-    Also provide any clarifying questions you'd like to ask the user as a JSON array named "clarifying_questions".
 
-    Feature Details:
-    {json.dumps(feature_data, indent=2)}
+###############################################################################
+# GPT ANALYSIS
+###############################################################################
+# overall_confidence and assumption_line lead the schema so the sidebar fills in first.
+# The schema and instructions form a byte-identical prefix across calls so OpenAI's
+# automatic prompt caching can reuse it; only the feature details vary (at the tail).
+SYSTEM_MESSAGE = dedent("""
+    You are an experienced product management assistant specializing in feature analysis.
+    Your role is to provide comprehensive, realistic, and data-driven analysis of product features.
+    You must be conservative in scoring and provide detailed justifications for all assessments.
+    Provide clarifying questions if you need more information from the user.
+""").strip()
+
+STATIC_PREFIX = dedent("""
+    Please provide a realistic confidence score on a 0-10 scale:
+    - 0-3 if the user input is nonsense or severely incomplete,
+    - 4-6 if there's partial or questionable data,
+    - 7-8 if the data is decent or typical,
+    - 9-10 if the input is extremely thorough with no ambiguities.
+
+    Analyze the feature given in the next message and provide a comprehensive evaluation in valid JSON.
+    Also provide any clarifying questions you'd like to ask the user as a JSON array named "clarifying_questions".
+""").strip()
 
-    Mandatory JSON Structure:
-    {{
-      "rice_scores": {{
-        "Reach": {{"value": int, "reason": string}},
-        "Impact": {{"value": int, "reason": string}},
-        "Confidence": {{"value": int, "reason": string}},
-        "Effort": {{"value": int, "reason": string}},
+# The structure is written out readably here and minified at module level: the model reads
+# it the same on one line, and every newline and indent would be sent on each call.
+_SCHEMA_SKELETON = dedent("""
+    {
+      "overall_confidence": float,
+      "assumption_line": string,
+      "rice_scores": {
+        "Reach": {"value": int, "reason": string},
+        "Impact": {"value": int, "reason": string},
+        "Confidence": {"value": int, "reason": string},
+        "Effort": {"value": int, "reason": string},
         "final_rice_score": float
-      }},
-      "moscow_priority": {{
+      },
+      "moscow_priority": {
         "category": string,
         "justification": string
-      }},
-      "risks": {{
+      },
+      "risks": {
         "technical_complexity": string,
         "business_model": string,
         "adoption": string,
         "competition": string
-      }},
-      "business_value": {{
+      },
+      "business_value": {
         "revenue_potential": string,
         "cost_savings": string,
         "market_positioning": string
-      }},
-      "implementation": {{
+      },
+      "implementation": {
         "complexity": string,
         "dependencies": string,
         "timeline": string
-      }},
+      },
       "mvp_recommendation": string,
       "roadmap": [
-          {{
+          {
               "Phase": string,
               "Timeline": string,
               "Milestone": string,
               "Success Metric": string
-          }}
+          }
       ],
       "industry_specific_considerations": string,
       "recommended_monetization": string,
-      "overall_confidence": float,
-      "confidence_improvement_areas": {{
+      "confidence_improvement_areas": {
           "Market Understanding": string,
           "Technical Feasibility": string,
           "Business Impact": string,
           "Implementation Clarity": string
-      }},
-      "swot_analysis": {{
+      },
+      "swot_analysis": {
         "Strengths": string,
         "Weaknesses": string,
         "Opportunities": string,
         "Threats": string
-      }},
-      "assumption_line": string,
+      },
       "clarifying_questions": [string, string, ...]
-    }}
-    """)
+    }
+""")
+_SCHEMA_SKELETON = re.sub(r"\s*\n\s*", "", _SCHEMA_SKELETON)
+_SCHEMA_SKELETON = re.sub(r'(?<=[:,])\s+', "", _SCHEMA_SKELETON)
+# Blank lines and indentation only cost input tokens; collapse them before any call.
+STATIC_PREFIX = re.sub(r"\n\s+", "\n", STATIC_PREFIX) + "\nMandatory JSON Structure: " + _SCHEMA_SKELETON
+
+
+def _partial_assumption_line(buffer: str) -> str:
+    match = _PARTIAL_ASSUMPTION_RE.search(buffer)
+    if not match:
+        return ""
+    try:
+        return _loads(f'"{match.group(1)}"')
+    except ValueError:  # cut off inside a \u escape
+        return ""
 
-    if not openai.api_key:
-        return {}
 
+def _analysis_cache_key(feature_data: dict) -> str:
+    """
+    Hashes the whitespace-stripped feature data, so trivially different submits share a key.
+    The model is part of the key so switching FEATUREFIT_MODEL never serves stale results.
+    """
+    normalized = {k: v.strip() if isinstance(v, str) else v for k, v in feature_data.items()}
+    normalized["_model"] = GPT_MODEL
+    return hashlib.blake2b(_dumps(normalized).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _disk_cache_get(key: str):
+    """
+    Returns the raw JSON response stored for `key` if it is younger than ANALYSIS_DISK_TTL.
+    """
+    try:
+        with closing(sqlite3.connect(ANALYSIS_CACHE_DB)) as conn:
+            row = conn.execute(
+                "SELECT json, ts FROM beta_analyses WHERE hash = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None or time.time() - row[1] >= ANALYSIS_DISK_TTL:
+        return None
+    return row[0]
+
+
+def _disk_cache_set(key: str, raw: str):
+    try:
+        with closing(sqlite3.connect(ANALYSIS_CACHE_DB)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS beta_analyses "
+                "(hash TEXT PRIMARY KEY, json TEXT, ts INTEGER)"
+            )
+            now = int(time.time())
+            conn.execute(
+                "INSERT OR REPLACE INTO beta_analyses VALUES (?, ?, ?)",
+                (key, raw, now)
+            )
+            conn.execute("DELETE FROM beta_analyses WHERE ts < ?", (now - ANALYSIS_DISK_TTL,))
+    except sqlite3.Error as exc:
+        logger.warning("Analysis cache write failed: %s", exc)
+
+
+@st.cache_resource
+def get_openai_client():
+    """
+    One OpenAI client shared across reruns and sessions; None when no API key is configured.
+    """
+    from openai import OpenAI  # deferred: only needed once an analysis is requested
+
+    load_dotenv()
+    api_key = os.getenv("OPENAI_API_KEY", "")
+    # The SDK's own retries are off; _call_openai retries transient errors itself.
+    return OpenAI(api_key=api_key, max_retries=0) if api_key else None
+
+
+@st.cache_resource
+def _analysis_store() -> dict:
+    """
+    Parsed analyses keyed by input hash as (analysis, ts). A plain store rather than
+    st.cache_data, because a streamed call writes to a placeholder that can't be replayed.
+    """
+    return {}
+
+
+def generate_visual_analysis(feature_data: dict, assumption_placeholder=None, confidence_placeholder=None) -> dict:
+    """
+    Returns the analysis for `feature_data`, reusing a cached response for identical inputs.
+    On a miss the response is streamed, with the assumption line and overall confidence
+    shown in their placeholders as they arrive. API and transport errors, and a response
+    that isn't valid JSON (e.g. cut off at max_tokens), are logged and yield an empty dict.
+    """
+    import httpx
+    import openai
+
+    client = get_openai_client()
+    if client is None:
+        return {}
+    key = _analysis_cache_key(feature_data)
+    store = _analysis_store()
+    entry = store.get(key)
+    if entry is not None and time.time() - entry[1] < ANALYSIS_CACHE_TTL:
+        return entry[0]
     try:
-        response = openai.ChatCompletion.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1,
-            max_tokens=2000,
-            top_p=1.0
-        )
-        return json.loads(response.choices[0].message.content.strip())
-    except Exception as exc:
-        logger.warning(f"GPT call failed: {exc}")
+        raw = _disk_cache_get(key)
+        if raw is None:
+            raw = _request_analysis(client, feature_data, assumption_placeholder, confidence_placeholder)
+            analysis = _loads(raw)
+            _disk_cache_set(key, raw)
+        else:
+            analysis = _loads(raw)
+    except (ValueError, openai.OpenAIError, httpx.HTTPError) as exc:  # JSONDecodeError is a ValueError
+        logger.warning("GPT call failed: %s", exc)
+        return {}
+    store.pop(key, None)
+    store[key] = (analysis, time.time())
+    while len(store) > ANALYSIS_CACHE_MAX_ENTRIES:  # oldest first, by insertion order
+        store.pop(next(iter(store)), None)
+    return analysis
+
+
+# Narrower than featurefit.py's policy: a failed call only costs this one analysis (or one
+# candidate of generate_best_analysis), so server errors surface instead of adding backoff.
+def _is_transient_error(exc: BaseException) -> bool:
+    import openai
+
+    return isinstance(exc, (openai.RateLimitError, openai.APIConnectionError, openai.APITimeoutError))
+
+
+# Shared by the sync (streaming) and async call sites; tenacity handles both.
+_openai_retry = retry(
+    wait=jittered_backoff(multiplier=0.5, max_wait=8),
+    stop=stop_after_attempt(4),
+    retry=retry_if_exception(_is_transient_error),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+
+
+@_openai_retry
+def _call_openai(client, **kwargs):
+    return client.chat.completions.create(**kwargs)
+
+
+@_openai_retry
+async def _acall_openai(client, **kwargs):
+    return await client.chat.completions.create(**kwargs)
+
+
+def _analysis_messages(feature_data: dict) -> list:
+    return [
+        {"role": "system", "content": SYSTEM_MESSAGE},
+        {"role": "user", "content": STATIC_PREFIX},
+        {"role": "user", "content": f"Feature Details:\n{_dumps(feature_data)}"}
+    ]
+
+
+def _request_analysis(client, feature_data: dict, assumption_placeholder=None, confidence_placeholder=None) -> str:
+    """
+    Temperature is kept low (0.1) to limit variability and produce more logical,
+    stable data. Everything else remains the same.
+
+    Streams a chat completion from GPT_MODEL in JSON mode and returns the raw JSON text
+    (RICE scores, clarifying_questions, etc.) once complete.
+    """
+    stream = _call_openai(
+        client,
+        model=GPT_MODEL,
+        messages=_analysis_messages(feature_data),
+        temperature=GPT_TEMPERATURE,
+        max_tokens=GPT_MAX_TOKENS,
+        top_p=1.0,
+        response_format={"type": "json_object"},
+        stream=True
+    )
+    buf = io.StringIO()
+    shown = ""
+    confidence_shown = False
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        buf.write(delta)
+        if confidence_placeholder is not None and not confidence_shown:
+            match = _PARTIAL_CONFIDENCE_RE.search(buf.getvalue())
+            if match:
+                confidence_shown = True
+                confidence_placeholder.markdown(_confidence_html(float(match.group(1))), unsafe_allow_html=True)
+        if assumption_placeholder is not None:
+            assumption = _partial_assumption_line(buf.getvalue())
+            if assumption and assumption != shown:
+                shown = assumption
+                assumption_placeholder.markdown(f"**Assumptions**: {assumption}")
+    return buf.getvalue()
+
+
+async def _analyze_models(api_key: str, feature_data: dict, models: list) -> list:
+    from openai import AsyncOpenAI
+
+    async with AsyncOpenAI(api_key=api_key, max_retries=0) as client:
+        async def _one(model: str) -> dict:
+            response = await _acall_openai(
+                client,
+                model=model,
+                messages=_analysis_messages(feature_data),
+                temperature=GPT_TEMPERATURE,
+                max_tokens=GPT_MAX_TOKENS,
+                top_p=1.0,
+                response_format={"type": "json_object"}
+            )
+            return _loads(response.choices[0].message.content)
+
+        return await asyncio.gather(*(_one(model) for model in models), return_exceptions=True)
+
+
+def generate_best_analysis(feature_data: dict, models: list) -> dict:
+    """
+    Runs the analysis on every model in `models` concurrently and keeps the answer with the
+    highest overall_confidence, so wall time is the slowest call rather than the sum.
+    """
+    client = get_openai_client()
+    if client is None:
         return {}
+    results = asyncio.run(_analyze_models(client.api_key, feature_data, models))
+    analyses = []
+    for model, result in zip(models, results):
+        if isinstance(result, BaseException):
+            logger.warning("GPT call failed for %s: %s", model, result)
+        elif result:
+            analyses.append(result)
+    return max(analyses, key=lambda a: a.get("overall_confidence", 0), default={})
+
+
+###############################################################################
+# RESPONSE MODEL
+###############################################################################
+# featurefit.py's strict Structured Outputs models, relaxed for beta's free-form JSON: extra
+# keys are ignored and a missing or null component falls back to a zero score instead of failing.
+class RiceComponent(analysis_schema.RiceComponent):
+    model_config = ConfigDict(extra="ignore")
+    value: Union[int, float] = 0
+    reason: str = "No justification"
+
+
+class RiceScores(analysis_schema.RiceScores):
+    model_config = ConfigDict(extra="ignore")
+    Reach: RiceComponent = Field(default_factory=RiceComponent)
+    Impact: RiceComponent = Field(default_factory=RiceComponent)
+    Confidence: RiceComponent = Field(default_factory=RiceComponent)
+    Effort: RiceComponent = Field(default_factory=RiceComponent)
+    final_rice_score: float = 0
+
+    @field_validator("Reach", "Impact", "Confidence", "Effort", mode="before")
+    @classmethod
+    def _null_component(cls, value):
+        return {} if value is None else value
+
+
+###############################################################################
+# FIGURES (cached on their inputs; the returned figures are shared, treat as read-only)
+###############################################################################
+# plotly is imported where first used, so the form-only page and
+# Streamlit's autoreload never pay for it.
+_RICE_LABELS = ("Reach","Impact","Confidence","Effort")
+_RICE_COLORS = ['#00fa92','#b5838d','#ffae00','#00b8d9']
+_PLOTLY_CONFIG = {"staticPlot": False, "responsive": True}
+
+# Confidence below 5 is red, below 7 orange, otherwise green.
+_CONF_THRESHOLDS = (5, 7)
+_CONF_COLORS = ("#f25f5c", "#ffaa00", "#00fa92")
+_CONFIDENCE_TMPL = """
+<div style="font-size:1.1rem;">
+    <strong>Overall Confidence:</strong> 
+    <span style="color:{color};">{score:.1f} / 10</span>
+</div>
+"""
+
+
+def _confidence_html(score: float) -> str:
+    return _CONFIDENCE_TMPL.format(color=_CONF_COLORS[bisect_right(_CONF_THRESHOLDS, score)], score=score)
+
+_MOSCOW_RE = re.compile(r"must|should|could", re.IGNORECASE)
+_MOSCOW_COLORS = {"must": "#f25f5c", "should": "#ffaa00", "could": "#00fa92"}
+_MOSCOW_DEFAULT_COLOR = "#94d0ff"
+
+
+@st.cache_resource(max_entries=128)
+def _build_radar(r_vals: tuple):
+    import plotly.graph_objects as go
+
+    radar_fig = go.Figure(go.Scatterpolargl(
+        r=r_vals + r_vals[:1],
+        theta=_RICE_LABELS + _RICE_LABELS[:1],
+        mode="lines",
+        line={"color": "#00b8d9"}
+    ))
+    radar_fig.update_layout(template="plotly_white")
+    return radar_fig
+
+
+@st.cache_resource(max_entries=128)
+def _build_gauge(final_score: float):
+    import plotly.graph_objects as go
+
+    return go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=final_score,
+        title={"text": "Feature Priority"},
+        gauge={
+            'axis': {'range': [0, 100], 'tickcolor': "#aaa", "tickwidth":1},
+            'bar': {'color': "#00fa92"},
+            'bgcolor': "#222222",
+            'steps': [
+                {'range': [0, 40], 'color': "#6d6875"},
+                {'range': [40, 70], 'color': "#b5838d"},
+                {'range': [70, 100], 'color': "#00b8d9"}
+            ]
+        }
+    ))
+
+
+@st.cache_resource(max_entries=128)
+def _build_bar(r_vals: tuple):
+    import plotly.graph_objects as go
+
+    bar_fig = go.Figure(go.Bar(
+        x=_RICE_LABELS,
+        y=r_vals,
+        marker_color=_RICE_COLORS,
+        text=r_vals,
+        textposition="outside",
+        textangle=0,
+        textfont_size=12
+    ))
+    bar_fig.update_layout(
+        title="RICE Components",
+        xaxis_title="Component",
+        yaxis_title="Score",
+        barmode="group"
+    )
+    return bar_fig
 
 
 def display_analysis(analysis_data: dict):
     """
     Displays the final analysis after it has been generated,
     including RICE visuals, clarifications, etc.
+    An analysis without RICE scores renders as a single error instead of zeroed charts.
     """
-    rice_scores = analysis_data.get("rice_scores", {})
+    if not analysis_data.get("rice_scores"):
+        st.error("Analysis failed or returned empty. Retry or reset.")
+        return
+    try:
+        rice = RiceScores.model_validate(analysis_data["rice_scores"])
+    except ValidationError:
+        st.error("Analysis failed or returned empty. Retry or reset.")
+        return
     moscow_priority = analysis_data.get("moscow_priority", {})
     risks = analysis_data.get("risks", {})
     business_value = analysis_data.get("business_value", {})
@@ -158,97 +516,48 @@ def display_analysis(analysis_data: dict):
     swot_analysis = analysis_data.get("swot_analysis", {})
     assumption_line = analysis_data.get("assumption_line", "")
 
-    # Overall Confidence
-    if overall_confidence < 5:
-        conf_color = "#f25f5c"  # bright red
-    elif overall_confidence < 7:
-        conf_color = "#ffaa00"  # neon orange
-    else:
-        conf_color = "#00fa92"  # neon green
-
     st.header("Visual Analysis")
 
     # RICE Score
     st.subheader("RICE Score")
     col_left, col_right = st.columns(2)
 
+    r_vals = tuple(getattr(rice, comp).value for comp in _RICE_LABELS)
+
     # Radar
     with col_left:
         st.markdown("#### RICE Radar")
-        r_vals = [
-            rice_scores.get("Reach",{}).get("value",0),
-            rice_scores.get("Impact",{}).get("value",0),
-            rice_scores.get("Confidence",{}).get("value",0),
-            rice_scores.get("Effort",{}).get("value",0)
-        ]
-        radar_data = pd.DataFrame({
-            "Metric": ["Reach","Impact","Confidence","Effort"],
-            "Score": r_vals
-        })
-        radar_fig = px.line_polar(
-            radar_data,
-            r="Score",
-            theta="Metric",
-            line_close=True,
-            color_discrete_sequence=['#00b8d9'],
-            template="plotly_white"
-        )
-        st.plotly_chart(radar_fig, use_container_width=True)
+        st.plotly_chart(_build_radar(r_vals), use_container_width=True, key="rice_radar", config=_PLOTLY_CONFIG)
 
     # Gauge
     with col_right:
         st.markdown("#### Priority Gauge")
-        final_rice_score = rice_scores.get("final_rice_score", 0)
-        gauge_fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=final_rice_score,
-            title={"text": "Feature Priority"},
-            gauge={
-                'axis': {'range': [0, 100], 'tickcolor': "#aaa", "tickwidth":1},
-                'bar': {'color': "#00fa92"},
-                'bgcolor': "#222222",
-                'steps': [
-                    {'range': [0, 40], 'color': "#6d6875"},
-                    {'range': [40, 70], 'color': "#b5838d"},
-                    {'range': [70, 100], 'color': "#00b8d9"}
-                ]
-            }
-        ))
-        st.plotly_chart(gauge_fig, use_container_width=True)
+        st.plotly_chart(_build_gauge(rice.final_rice_score), use_container_width=True, key="priority_gauge", config=_PLOTLY_CONFIG)
 
     # RICE Justifications
     st.markdown("#### RICE Justifications")
-    justifications_list = []
-    for comp in ["Reach","Impact","Confidence","Effort"]:
-        cinfo = rice_scores.get(comp,{})
-        cVal = cinfo.get("value",0)
-        cReason = cinfo.get("reason","No justification")
-        justifications_list.append({
-            "Component": comp,
-            "Value": cVal,
-            "Justification": cReason
-        })
-    st.table(pd.DataFrame(justifications_list))
+    rows = "".join(
+        _JUSTIFICATION_ROW_TMPL.format(
+            component=comp,
+            value=escape(str(getattr(rice, comp).value)),
+            reason=escape(str(getattr(rice, comp).reason))
+        )
+        for comp in _RICE_LABELS
+    )
+    st.markdown(_JUSTIFICATIONS_TABLE_TMPL.format(rows=rows), unsafe_allow_html=True)
 
     # MoSCoW Priority
     st.subheader("MoSCoW Priority")
     category_raw = moscow_priority.get("category","N/A")
     justification_txt = moscow_priority.get("justification","")
-    cat_lower = category_raw.lower()
-    if "must" in cat_lower:
-        moscow_color = "#f25f5c"
-    elif "should" in cat_lower:
-        moscow_color = "#ffaa00"
-    elif "could" in cat_lower:
-        moscow_color = "#00fa92"
-    else:
-        moscow_color = "#94d0ff"
+    moscow_match = _MOSCOW_RE.search(category_raw)
+    moscow_color = _MOSCOW_COLORS[moscow_match.group(0).lower()] if moscow_match else _MOSCOW_DEFAULT_COLOR
 
     st.markdown(
-        f"<div style='font-size:1.11rem; color:{moscow_color};'><strong>{category_raw}</strong></div>",
+        f"<div style='font-size:1.11rem; color:{moscow_color};'><strong>{escape(str(category_raw))}</strong></div>\n\n"
+        f"*Justification*: {escape(str(justification_txt))}",
         unsafe_allow_html=True
     )
-    st.markdown(f"*Justification*: {justification_txt}")
 
     # Implementation
     st.subheader("Implementation Overview")
@@ -261,21 +570,7 @@ def display_analysis(analysis_data: dict):
 
     # RICE Scoring Breakdown
     st.subheader("RICE Scoring Breakdown")
-    breakdown_data = pd.DataFrame({
-        "Component": ["Reach","Impact","Confidence","Effort"],
-        "Score": r_vals
-    })
-    bar_fig = px.bar(
-        breakdown_data,
-        x="Component",
-        y="Score",
-        color="Component",
-        color_discrete_sequence=['#00fa92','#b5838d','#ffae00','#00b8d9'],
-        text="Score",
-        title="RICE Components"
-    )
-    bar_fig.update_traces(textfont_size=12, textangle=0, textposition="outside")
-    st.plotly_chart(bar_fig, use_container_width=True)
+    st.plotly_chart(_build_bar(r_vals), use_container_width=True, key="rice_bar", config=_PLOTLY_CONFIG)
 
     # Risks
     st.subheader("Risk Assessment")
@@ -288,11 +583,18 @@ def display_analysis(analysis_data: dict):
 
     # MVP Roadmap
     st.subheader("MVP Roadmap")
-    st.markdown(f"**Recommendation**: {mvp_recommendation}")
+    st.markdown(f"**Recommendation**: {mvp_recommendation}" + ("\n\n**Roadmap Phases**:" if roadmap else ""))
     if roadmap:
-        st.markdown("**Roadmap Phases**:")
-        roadmap_df = pd.DataFrame(roadmap)
-        st.dataframe(roadmap_df.style.background_gradient(cmap='Blues'), use_container_width=True)
+        rows = "".join(
+            _ROADMAP_ROW_TMPL.format(
+                phase=escape(str(phase.get("Phase", ""))),
+                timeline=escape(str(phase.get("Timeline", ""))),
+                milestone=escape(str(phase.get("Milestone", ""))),
+                metric=escape(str(phase.get("Success Metric", "")))
+            )
+            for phase in roadmap
+        )
+        st.markdown(_ROADMAP_TABLE_TMPL.format(rows=rows), unsafe_allow_html=True)
     else:
         st.info("No roadmap data provided.")
 
@@ -307,8 +609,7 @@ def display_analysis(analysis_data: dict):
     # Confidence Improvement
     st.subheader("Confidence Improvement Areas")
     if confidence_improvements:
-        for k, v in confidence_improvements.items():
-            st.markdown(f"• **{k}**: {v}")
+        st.markdown("  \n".join(f"• **{k}**: {v}" for k, v in confidence_improvements.items()))
     else:
         st.markdown("_No specific improvements provided._")
 
@@ -318,75 +619,174 @@ def display_analysis(analysis_data: dict):
     weaknesses = swot_analysis.get("Weaknesses","N/A")
     opportunities = swot_analysis.get("Opportunities","N/A")
     threats = swot_analysis.get("Threats","N/A")
-    swot_table = f"""
-    <style>
-        .swot-table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 1rem;
-        }}
-        .swot-table th, .swot-table td {{
-            border: 1px solid #3c3c3c;
-            padding: 8px;
-            text-align: left;
-        }}
-        .swot-table th {{
-            background-color: #00b8d9;
-            color: #ffffff;
-        }}
-        .swot-table td {{
-            background-color: #2f3142;
-            color: #ffffff;
-        }}
-        .swot-table .opportunities {{
-            background-color: #ffaa00;
-            color: #1d1f27;
-        }}
-        .swot-table .threats {{
-            background-color: #f25f5c;
-            color: #ffffff;
-        }}
-    </style>
-    <table class="swot-table">
-        <tr>
-            <th>Strengths</th>
-            <th>Weaknesses</th>
-        </tr>
-        <tr>
-            <td>{strengths}</td>
-            <td>{weaknesses}</td>
-        </tr>
-        <tr>
-            <th>Opportunities</th>
-            <th>Threats</th>
-        </tr>
-        <tr>
-            <td class="opportunities">{opportunities}</td>
-            <td class="threats">{threats}</td>
-        </tr>
-    </table>
-    """
+    swot_table = _SWOT_TABLE_TMPL.format_map({
+        "strengths": escape(str(strengths)),
+        "weaknesses": escape(str(weaknesses)),
+        "opportunities": escape(str(opportunities)),
+        "threats": escape(str(threats))
+    })
     st.markdown(swot_table, unsafe_allow_html=True)
 
 
+###############################################################################
+# FORM OPTIONS & STATIC MARKUP (module constants, not rebuilt inside render functions)
+###############################################################################
+# Extended business models
+_BUSINESS_MODELS = [
+    "B2B SaaS", "B2C SaaS", "Marketplace", "Subscription-based service", "Freemium",
+    "Licensing", "On-premise software", "Advertising-based", "Pay-per-use",
+    "Commission-based", "Affiliate marketing", "Consulting-based",
+    "Peer-to-peer lending", "Crowdfunding", "Franchise model", "Direct sales",
+    "Manufacturing", "Dropshipping", "Aggregator", "Community-based",
+    "Data as a Service", "IoT-based", "Blockchain-based", "Open-source with support",
+    "Hybrid licensing model", "Usage-based analytics", "Microtransactions",
+    "In-app purchases", "Subscription box", "Government contracting",
+    "Non-profit donor-funded", "Reseller model", "White-labeling",
+    "Professional services", "Ecommerce store"
+]
+
+# Industry options
+_INDUSTRIES = ["FinTech", "EdTech", "SaaS", "Healthcare", "E-commerce", "AI Tools", "Custom"]
+
+_BUSINESS_MODEL_INDEX = {name: i for i, name in enumerate(_BUSINESS_MODELS)}
+_INDUSTRY_INDEX = {name: i for i, name in enumerate(_INDUSTRIES)}
+
+# Table markup: the static stylesheet plus small str.format templates for the cells.
+# Styles for the SWOT and data tables and the floating buttons. Streamlit removes any element a rerun
+# does not emit again, so this goes out once per run rather than once per session;
+# whitespace is collapsed to keep the payload small.
+_STATIC_CSS = """<style>
+.swot-table {
+    width: 100%;
+    border-collapse: collapse;
+    margin-top: 1rem;
+}
+.swot-table th, .swot-table td {
+    border: 1px solid #3c3c3c;
+    padding: 8px;
+    text-align: left;
+}
+.swot-table th {
+    background-color: #00b8d9;
+    color: #ffffff;
+}
+.swot-table td {
+    background-color: #2f3142;
+    color: #ffffff;
+}
+.swot-table .opportunities {
+    background-color: #ffaa00;
+    color: #1d1f27;
+}
+.swot-table .threats {
+    background-color: #f25f5c;
+    color: #ffffff;
+}
+.data-table {
+    width: 100%;
+    border-collapse: collapse;
+    margin: 0.5rem 0 1rem;
+}
+.data-table th, .data-table td {
+    border-bottom: 1px solid #3c3c3c;
+    padding: 8px;
+    text-align: left;
+    vertical-align: top;
+}
+.float-btns {
+    position: fixed;
+    bottom: 20px; 
+    right: 20px;
+    display: flex;
+    flex-direction: column;
+    gap: 8px;
+    z-index: 9999;
+}
+.float-btns a {
+    text-decoration: none;
+    font-size: 14px;
+    background: #4a5eab; 
+    color: #fff;
+    padding: 8px 12px;
+    border-radius: 8px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.3);
+    transition: background 0.2s;
+}
+.float-btns a:hover {
+    background: #3c4b90;
+}
+
+@media screen and (max-width: 768px) {
+    .float-btns {
+        bottom: 90px; 
+        right: 10px;
+        gap: 12px;
+        padding: 16px;
+    }
+    .float-btns .blogs-link {
+        display: none;
+    }
+}
+</style>"""
+_STATIC_CSS = re.sub(r"\s*\n\s*", "", _STATIC_CSS)
+_SWOT_TABLE_TMPL = """<table class="swot-table">
+    <tr>
+        <th>Strengths</th>
+        <th>Weaknesses</th>
+    </tr>
+    <tr>
+        <td>{strengths}</td>
+        <td>{weaknesses}</td>
+    </tr>
+    <tr>
+        <th>Opportunities</th>
+        <th>Threats</th>
+    </tr>
+    <tr>
+        <td class="opportunities">{opportunities}</td>
+        <td class="threats">{threats}</td>
+    </tr>
+</table>
+"""
+# The RICE justifications and roadmap are a handful of text rows, which plain HTML
+# renders without building a DataFrame and shipping it through Arrow.
+_JUSTIFICATIONS_TABLE_TMPL = (
+    '<table class="data-table"><tr><th>Component</th><th>Value</th><th>Justification</th></tr>{rows}</table>'
+)
+_JUSTIFICATION_ROW_TMPL = "<tr><td>{component}</td><td>{value}</td><td>{reason}</td></tr>"
+_ROADMAP_TABLE_TMPL = (
+    '<table class="data-table"><tr><th>Phase</th><th>Timeline</th><th>Milestone</th>'
+    '<th>Success Metric</th></tr>{rows}</table>'
+)
+_ROADMAP_ROW_TMPL = "<tr><td>{phase}</td><td>{timeline}</td><td>{milestone}</td><td>{metric}</td></tr>"
+
+
+_STATE_DEFAULTS = {
+    "feature_name": "AI-Powered Transaction Fraud Detection",
+    "industry_option": "FinTech",
+    "industry": "FinTech",
+    "business_goal": "Increase Revenue",
+    "business_model": "B2B SaaS",
+    "clarifications": "",
+    "analysis_data": {},  # only ever replaced, never mutated, so sharing it is safe
+}
+
+_FLOAT_BTNS_HTML = """<div class="float-btns">
+    <a href="https://sabyasachimishra.dev" target="_blank">Portfolio</a>
+    <a href="https://www.linkedin.com/in/sabyasachimishra007" target="_blank">LinkedIn</a>
+    <a href="https://github.com/SABYA648" target="_blank">GitHub</a>
+    <a class="blogs-link" href="https://medium.com/@sabya" target="_blank">Blogs</a>
+</div>
+"""
+
+
 def main():
     # State initialization
-    if "feature_name" not in st.session_state:
-        st.session_state["feature_name"] = "AI-Powered Transaction Fraud Detection"
-    if "industry_option" not in st.session_state:
-        st.session_state["industry_option"] = "FinTech"
-    if "industry" not in st.session_state:
-        st.session_state["industry"] = "FinTech"
-    if "business_goal" not in st.session_state:
-        st.session_state["business_goal"] = "Increase Revenue"
-    if "business_model" not in st.session_state:
-        st.session_state["business_model"] = "B2B SaaS"
-    if "clarifications" not in st.session_state:
-        st.session_state["clarifications"] = ""
-    if "analysis_data" not in st.session_state:
-        st.session_state["analysis_data"] = {}
+    for key, default in _STATE_DEFAULTS.items():
+        st.session_state.setdefault(key, default)
 
     st.title("🚀 FeatureFit: AI-Powered Feature Prioritization")
+    st.markdown(_STATIC_CSS, unsafe_allow_html=True)
 
     # SIDEBAR placeholders
     st.sidebar.markdown("## About")
@@ -405,23 +805,6 @@ they will appear here in the sidebar after the first analysis.
     st.sidebar.markdown("[GitHub](https://github.com/SABYA648)")
     st.sidebar.markdown("[Blogs](https://medium.com/@sabya)\n")
 
-    # Extended business models
-    _business_models = [
-        "B2B SaaS", "B2C SaaS", "Marketplace", "Subscription-based service", "Freemium",
-        "Licensing", "On-premise software", "Advertising-based", "Pay-per-use",
-        "Commission-based", "Affiliate marketing", "Consulting-based",
-        "Peer-to-peer lending", "Crowdfunding", "Franchise model", "Direct sales",
-        "Manufacturing", "Dropshipping", "Aggregator", "Community-based",
-        "Data as a Service", "IoT-based", "Blockchain-based", "Open-source with support",
-        "Hybrid licensing model", "Usage-based analytics", "Microtransactions",
-        "In-app purchases", "Subscription box", "Government contracting",
-        "Non-profit donor-funded", "Reseller model", "White-labeling",
-        "Professional services", "Ecommerce store"
-    ]
-
-    # Industry options
-    _industries = ["FinTech", "EdTech", "SaaS", "Healthcare", "E-commerce", "AI Tools", "Custom"]
-
     # MAIN FORM
     with st.form("analysis_form"):
         st.header("📌 Feature Configuration")
@@ -433,14 +816,11 @@ they will appear here in the sidebar after the first analysis.
                 st.session_state["feature_name"]
             )
         with col2:
-            try:
-                idx_ind = _industries.index(st.session_state["industry_option"])
-            except ValueError:
-                idx_ind = 0
+            idx_ind = _INDUSTRY_INDEX.get(st.session_state["industry_option"], 0)
 
             st.session_state["industry_option"] = st.selectbox(
                 "Industry *",
-                _industries,
+                _INDUSTRIES,
                 index=idx_ind
             )
             if st.session_state["industry_option"] == "Custom":
@@ -457,14 +837,11 @@ they will appear here in the sidebar after the first analysis.
         )
 
         # business model
-        try:
-            idx_bm = _business_models.index(st.session_state["business_model"])
-        except ValueError:
-            idx_bm = 0
+        idx_bm = _BUSINESS_MODEL_INDEX.get(st.session_state["business_model"], 0)
 
         st.session_state["business_model"] = st.selectbox(
             "Business Model",
-            _business_models,
+            _BUSINESS_MODELS,
             index=idx_bm
         )
 
@@ -490,7 +867,7 @@ they will appear here in the sidebar after the first analysis.
                 "business_model": st.session_state["business_model"],
                 "context": st.session_state["context"]
             }
-            st.session_state["analysis_data"] = generate_visual_analysis(feature_data)
+            st.session_state["analysis_data"] = generate_visual_analysis(feature_data, placeholder_assumptions, placeholder_confidence)
 
     # If we have analysis data, display it
     if st.session_state["analysis_data"]:
@@ -500,22 +877,7 @@ they will appear here in the sidebar after the first analysis.
         clarifying_questions = analysis_data.get("clarifying_questions", [])
 
         # Left sidebar placeholders
-        if overall_confidence < 5:
-            conf_color = "#f25f5c"
-        elif overall_confidence < 7:
-            conf_color = "#ffaa00"
-        else:
-            conf_color = "#00fa92"
-
-        placeholder_confidence.markdown(
-            f"""
-            <div style="font-size:1.1rem;">
-                <strong>Overall Confidence:</strong> 
-                <span style="color:{conf_color};">{overall_confidence:.1f} / 10</span>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+        placeholder_confidence.markdown(_confidence_html(overall_confidence), unsafe_allow_html=True)
 
         if assumption_line:
             placeholder_assumptions.markdown(f"**Assumptions**: {assumption_line}")
@@ -550,7 +912,10 @@ they will appear here in the sidebar after the first analysis.
                         "context": "Detects fraudulent transactions in real time using advanced AI."
                                    + st.session_state["clarifications"]
                     }
-                    st.session_state["analysis_data"] = generate_visual_analysis(new_feature_data)
+                    if GPT_COMPARE_MODELS:
+                        st.session_state["analysis_data"] = generate_best_analysis(new_feature_data, GPT_COMPARE_MODELS)
+                    else:
+                        st.session_state["analysis_data"] = generate_visual_analysis(new_feature_data, placeholder_assumptions, placeholder_confidence)
 
                     if st.session_state["analysis_data"]:
                         st.success("Re-analysis completed with clarifications.")
@@ -569,54 +934,7 @@ they will appear here in the sidebar after the first analysis.
         )
 
     # FLOATING BUTTONS
-    st.markdown(
-        """
-        <style>
-        .float-btns {
-            position: fixed;
-            bottom: 20px; 
-            right: 20px;
-            display: flex;
-            flex-direction: column;
-            gap: 8px;
-            z-index: 9999;
-        }
-        .float-btns a {
-            text-decoration: none;
-            font-size: 14px;
-            background: #4a5eab; 
-            color: #fff;
-            padding: 8px 12px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.3);
-            transition: background 0.2s;
-        }
-        .float-btns a:hover {
-            background: #3c4b90;
-        }
-
-        @media screen and (max-width: 768px) {
-            .float-btns {
-                bottom: 90px; 
-                right: 10px;
-                gap: 12px;
-                padding: 16px;
-            }
-            .float-btns .blogs-link {
-                display: none;
-            }
-        }
-        </style>
-
-        <div class="float-btns">
-            <a href="https://sabyasachimishra.dev" target="_blank">Portfolio</a>
-            <a href="https://www.linkedin.com/in/sabyasachimishra007" target="_blank">LinkedIn</a>
-            <a href="https://github.com/SABYA648" target="_blank">GitHub</a>
-            <a class="blogs-link" href="https://medium.com/@sabya" target="_blank">Blogs</a>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    st.markdown(_FLOAT_BTNS_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
@@ -1,37 +1,222 @@
 import os
-import json
+import orjson
 import logging
-from textwrap import dedent
+import asyncio
+import csv
 import hashlib
+import io
+import re
+from html import escape
+from string import Template
+import sqlite3
+import threading
+import time
+from bisect import bisect_right
+from contextlib import closing
+from logging.handlers import RotatingFileHandler
+from typing import TYPE_CHECKING
 
 import streamlit as st
 import streamlit.components.v1 as components
-from dotenv import load_dotenv
-import openai
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import plotly.io as pio
+import httpx
+from tenacity import before_sleep_log, retry, retry_if_exception, stop_after_attempt
+
+from analysis_schema import ANALYSIS_RESPONSE_FORMAT, ANALYSIS_SECTIONS, Analysis, ScoresSection
+from retry_policy import jittered_backoff
+try:
+    import h2  # noqa: F401  (httpx only negotiates HTTP/2 when h2 is installed)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+# openai (~0.3s to import) and dotenv are imported where first used, so opening the
+# form page and Streamlit's hot-reload never pay for them.
 # PDF generation is currently disabled (Coming Soon)
 
 # -----------------------------------------------------------------------------
 # Logging & Environment Setup
 # -----------------------------------------------------------------------------
-logging.basicConfig(
-    filename='app.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# app.log rolls over at 1 MB into app.log.1-.3. The script body reruns on every
+# interaction, so the handler is only built (and the file only opened) while the root
+# logger has none; later reruns reuse it.
 logger = logging.getLogger(__name__)
-load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY", "")
-logger.info("Application started in LIVE mode")
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        handlers=[RotatingFileHandler('app.log', maxBytes=1_000_000, backupCount=3)],
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    logger.info("Application started in LIVE mode")
+
+GPT_MODEL = os.getenv("FEATUREFIT_MODEL", "gpt-4o-mini")
+# Offered in the sidebar; the default model comes first and is preselected.
+GPT_MODEL_CHOICES = tuple(dict.fromkeys((GPT_MODEL, "gpt-4o-mini", "gpt-4o")))
+GPT_TEMPERATURE = 0.1
+GPT_MAX_TOKENS = 1800  # headroom over the full analysis schema (~1.2k tokens)
+GPT_SECTION_MAX_TOKENS = 600  # per sub-call when the analysis is split into sections
+GPT_SEED = 42  # best-effort determinism, so a cached answer matches what a fresh call would give
+ANALYSIS_CACHE_TTL = 3600  # seconds an analysis stays in memory after it was last loaded
+ANALYSIS_CACHE_MAX_ENTRIES = 128  # in-memory analyses kept per process; older ones stay on disk
+ANALYSIS_DISK_TTL = 7 * 24 * 3600  # seconds it stays in the SQLite cache, across restarts
+ANALYSIS_CACHE_DB = ".featurefit_cache.sqlite3"
+ANALYSIS_CONCURRENCY = 5  # concurrent requests, kept under the account's RPM limit
+SECTION_MAX_CONNECTIONS = 16  # pool size shared by one analysis's section calls
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+ANALYSIS_DEADLINE = 45  # seconds for one interactive analysis, retries included
+SEMANTIC_CACHE_MODEL = "text-embedding-3-small"
+SEMANTIC_CACHE_THRESHOLD = 0.93  # cosine similarity above which inputs count as the same feature
+# A semantic match must share these exactly; only the free-text fields are embedded.
+_SEMANTIC_SCOPE_FIELDS = ("industry", "business_model")
+_SEMANTIC_TEXT_FIELDS = ("feature_name", "business_goal", "context")
+ADMIN_MODE = os.getenv("FEATUREFIT_ADMIN", "").lower() in ("1", "true", "yes")
+_CSV_FIELDS = ("feature_name", "industry", "business_goal", "business_model", "context")
+
+# The form opens on this scenario, and most first visits analyze it unchanged, so a
+# snapshot of its analysis ships with the app. Regenerate default_analysis.json with
+# regenerate_default_analysis() whenever the prompt or schema changes.
+_DEFAULT_FEATURE = {
+    "feature_name": "AI-Powered Transaction Fraud Detection",
+    "industry": "FinTech",
+    "business_goal": "Increase Revenue",
+    "business_model": "B2B SaaS",
+    "context": "Detects fraudulent transactions in real time using advanced AI."
+}
+_DEFAULT_ANALYSIS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "default_analysis.json")
+
+@st.cache_resource
+def default_analysis():
+    """
+    The bundled snapshot, read and validated against the Analysis schema once per process.
+    None when it is missing or no longer matches the schema.
+    """
+    try:
+        with open(_DEFAULT_ANALYSIS_PATH, "rb") as snapshot:
+            return Analysis.model_validate_json(snapshot.read()).model_dump(by_alias=True)
+    except (OSError, ValueError) as exc:  # pydantic's ValidationError is a ValueError
+        logger.warning("Default analysis snapshot unavailable: %s", exc)
+        return None
+
+_BUSINESS_MODELS = [
+    "B2B SaaS", "B2C SaaS", "Marketplace", "Subscription-based service", "Freemium",
+    "Licensing", "On-premise software", "Advertising-based", "Pay-per-use",
+    "Commission-based", "Affiliate marketing", "Consulting-based",
+    "Peer-to-peer lending", "Crowdfunding", "Franchise model", "Direct sales",
+    "Manufacturing", "Dropshipping", "Aggregator", "Community-based",
+    "Data as a Service", "IoT-based", "Blockchain-based", "Open-source with support",
+    "Hybrid licensing model", "Usage-based analytics", "Microtransactions",
+    "In-app purchases", "Subscription box", "Government contracting"
+]
+_INDUSTRIES = ["FinTech", "EdTech", "SaaS", "Healthcare", "E-commerce", "AI Tools", "Custom"]
+_BUSINESS_MODEL_INDEX = {name: i for i, name in enumerate(_BUSINESS_MODELS)}
+_INDUSTRY_INDEX = {name: i for i, name in enumerate(_INDUSTRIES)}
+
+_RICE_COMPONENTS = ("Reach", "Impact", "Confidence", "Effort")
+_RICE_BAR_COLORS = ("#00fa92", "#b5838d", "#ffae00", "#00b8d9")
+_RISK_FIELDS = (
+    ("technical_complexity", "Technical Complexity"),
+    ("business_model", "Business Model"),
+    ("adoption", "Adoption"),
+    ("competition", "Competition")
+)
+
+_PARTIAL_RICE_RE = re.compile(
+    r'"(Reach|Impact|Confidence|Effort)"\s*:\s*\{\s*"value"\s*:\s*(-?\d+(?:\.\d+)?)\s*[,}]'
+)
+_PARTIAL_FINAL_RICE_RE = re.compile(r'"final_rice_score"\s*:\s*(-?\d+(?:\.\d+)?)\s*[,}]')
+_MOSCOW_RE = re.compile(r"must|should|could", re.IGNORECASE)
+_MOSCOW_COLORS = {"must": "#f25f5c", "should": "#ffaa00", "could": "#00fa92"}
+_MOSCOW_DEFAULT_COLOR = "#94d0ff"
+# Overall confidence below 5 is red, below 7 amber, otherwise green.
+_CONF_THRESHOLDS = (5, 7)
+_CONF_COLORS = ("#f25f5c", "#ffaa00", "#00fa92")
+
+# -----------------------------------------------------------------------------
+# HTML TEMPLATES (Values are HTML-escaped at substitution time)
+# -----------------------------------------------------------------------------
+_MOSCOW_TPL = Template(
+    "<div style='font-size:1.1rem; color:$color;'><strong>$category</strong></div>"
+)
+_CONFIDENCE_TPL = Template(
+    "<div style='font-size:1.1rem;'><strong>Overall Confidence:</strong> "
+    "<span style='color:$color;'>$score / 10</span></div>"
+)
+_SWOT_TABLE_TPL = Template("""
+    <table class="swot-table">
+        <tr>
+            <th>Strengths</th>
+            <th>Weaknesses</th>
+        </tr>
+        <tr>
+            <td>$strengths</td>
+            <td>$weaknesses</td>
+        </tr>
+        <tr>
+            <th>Opportunities</th>
+            <th>Threats</th>
+        </tr>
+        <tr>
+            <td class="opportunities">$opportunities</td>
+            <td class="threats">$threats</td>
+        </tr>
+    </table>
+    """)
+_ROADMAP_TABLE_TPL = Template("""
+    <table class="roadmap-table">
+        <tr>
+            <th>Phase</th>
+            <th>Timeline</th>
+            <th>Milestone</th>
+            <th>Success Metric</th>
+        </tr>
+        $rows
+    </table>
+    """)
+_ROADMAP_ROW_TPL = Template(
+    "<tr><td>$phase</td><td>$timeline</td><td>$milestone</td><td>$metric</td></tr>"
+)
+
+_JUSTIFICATIONS_TABLE_TPL = Template("""
+    <table class="justifications-table">
+        <tr>
+            <th>Component</th>
+            <th>Value</th>
+            <th>Justification</th>
+        </tr>
+        $rows
+    </table>
+    """)
+_JUSTIFICATION_ROW_TPL = Template("<tr><td>$component</td><td>$value</td><td>$reason</td></tr>")
+
+# -----------------------------------------------------------------------------
+# PROMPT TEMPLATES (Pre-dedented; only the feature details vary per call)
+# -----------------------------------------------------------------------------
+# The JSON shape is enforced through Structured Outputs (see analysis_schema.py), so
+# the prompts only describe what to analyze.
+_SYSTEM_MESSAGE = (
+    "You are an experienced product management assistant specializing in feature analysis.\n"
+    "Your role is to provide comprehensive, realistic, and data-driven analysis of product features.\n"
+    "You must be conservative in scoring and provide detailed justifications for all assessments."
+)
+_CONFIDENCE_RUBRIC = """Please provide a realistic confidence score on a 0-10 scale:
+- 0-3 if the user input is nonsense or severely incomplete,
+- 4-6 if there's partial or questionable data,
+- 7-8 if the data is decent or typical,
+- 9-10 if the input is extremely thorough with no ambiguities.
+Also list any clarifying questions you'd like to ask the user (or none).
+
+"""
+_PROMPT_TPL = Template("""${rubric}Analyze the following feature and provide $scope.
+
+Feature Details:
+$feature_details""")
 
 # -----------------------------------------------------------------------------
 # CUSTOM CSS INJECTION (High Contrast & Button Styling)
 # -----------------------------------------------------------------------------
-def inject_custom_css():
-    custom_css = """
+# Streamlit drops any element a rerun doesn't emit again, so the stylesheet (including
+# the floating-button rules) goes out once per run with its whitespace collapsed.
+_CUSTOM_CSS = """
     <style>
     /* Global high-contrast styling */
     body {
@@ -97,9 +282,108 @@ def inject_custom_css():
     #main-analysis-btn-container button:hover {
         background-color: darkred !important;
     }
+    /* Floating quick links */
+    .float-btns {
+        position: fixed;
+        bottom: 20px;
+        right: 20px;
+        display: flex;
+        flex-direction: column;
+        gap: 8px;
+        z-index: 9999;
+    }
+    .float-btns a {
+        text-decoration: none;
+        font-size: 14px;
+        background: #4a5eab;
+        color: #fff;
+        padding: 8px 12px;
+        border-radius: 8px;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.3);
+        transition: background 0.2s;
+    }
+    .float-btns a:hover {
+        background: #3c4b90;
+    }
+    @media screen and (max-width: 768px) {
+        .float-btns {
+            bottom: 90px;
+            right: 10px;
+            gap: 12px;
+            padding: 16px;
+        }
+        .float-btns .blogs-link {
+            display: none;
+        }
+    }
+    /* Analysis tables (SWOT, roadmap, RICE justifications) */
+    .swot-table {
+        width: 100%;
+        border-collapse: collapse;
+        margin-top: 1rem;
+    }
+    .swot-table th, .swot-table td {
+        border: 1px solid #3c3c3c;
+        padding: 8px;
+        text-align: left;
+    }
+    .swot-table th {
+        background-color: #00b8d9;
+        color: #ffffff;
+    }
+    .swot-table td {
+        background-color: #2f3142;
+        color: #ffffff;
+    }
+    .swot-table .opportunities {
+        background-color: #ffaa00;
+        color: #1d1f27;
+    }
+    .swot-table .threats {
+        background-color: #f25f5c;
+        color: #ffffff;
+    }
+    /* Static shading alternates roadmap rows, replacing the matplotlib-backed gradient Styler. */
+    .roadmap-table {
+        width: 100%;
+        border-collapse: collapse;
+        margin: 0.5rem 0 1rem;
+    }
+    .roadmap-table th, .roadmap-table td {
+        border: 1px solid #3c3c3c;
+        padding: 8px;
+        text-align: left;
+        vertical-align: top;
+    }
+    .roadmap-table th {
+        background-color: #1f4e79;
+        color: #ffffff;
+    }
+    .roadmap-table tr:nth-child(odd) td {
+        background-color: #dbe9f6;
+        color: #1d1f27;
+    }
+    .roadmap-table tr:nth-child(even) td {
+        background-color: #9ecae1;
+        color: #1d1f27;
+    }
+    .justifications-table {
+        width: 100%;
+        border-collapse: collapse;
+        margin: 0.5rem 0 1rem;
+    }
+    .justifications-table th, .justifications-table td {
+        border-bottom: 1px solid #3c3c3c;
+        padding: 8px;
+        text-align: left;
+        vertical-align: top;
+    }
     </style>
     """
-    st.markdown(custom_css, unsafe_allow_html=True)
+_CUSTOM_CSS = re.sub(r"\s*\n\s*", "", _CUSTOM_CSS)
+
+def inject_custom_css():
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
 
 # -----------------------------------------------------------------------------
 # SESSION STATE INITIALIZATION (Clarifications Mechanism)
@@ -110,6 +394,11 @@ if 'gpt_response' not in st.session_state:
     st.session_state['gpt_response'] = None
 if 'analysis_data' not in st.session_state:
     st.session_state['analysis_data'] = None
+if 'analysis_key' not in st.session_state:
+    st.session_state['analysis_key'] = None
+if 'bulk_batch_id' not in st.session_state:
+    # Kept in the URL too, so a bulk run can be picked up again after closing the tab.
+    st.session_state['bulk_batch_id'] = st.query_params.get("bulk_batch")
 
 # -----------------------------------------------------------------------------
 # STATE RESET FUNCTION (Reset Analysis Option)
@@ -118,117 +407,700 @@ def reset_analysis():
     st.session_state['clarifications'] = ""
     st.session_state['gpt_response'] = None
     st.session_state['analysis_data'] = None
+    st.session_state['analysis_key'] = None
+    st.session_state.pop('radar_png', None)
+    st.session_state.pop('bar_png', None)
     st.success("Analysis state has been reset. Clean slate, just like you needed!")
 
 # -----------------------------------------------------------------------------
 # GENERATE VISUAL ANALYSIS FUNCTION (LIVE MODE)
 # -----------------------------------------------------------------------------
-@st.cache_data(show_spinner=False)
-def generate_visual_analysis(feature_data: dict) -> dict:
+@st.cache_resource
+def get_openai_client():
     """
-    Constructs a detailed prompt and makes a live GPT API call.
-    Returns the parsed JSON response.
+    Builds one OpenAI client (and its pooled HTTP connections) shared across reruns
+    and sessions. Returns None when no API key is configured.
     """
-    # Updated system message to force clarifying_questions and overall_confidence in output.
-    system_message = dedent("""
-        You are an experienced product management assistant specializing in feature analysis.
-        Your role is to provide comprehensive, realistic, and data-driven analysis of product features.
-        You must be conservative in scoring and provide detailed justifications for all assessments.
-        Always include an "overall_confidence" score (0-10) and a "clarifying_questions" array (even if empty) in your response.
-    """)
-    custom_instructions = dedent("""
-        Please provide a realistic confidence score on a 0-10 scale:
-        - 0-3 if the user input is nonsense or severely incomplete,
-        - 4-6 if there's partial or questionable data,
-        - 7-8 if the data is decent or typical,
-        - 9-10 if the input is extremely thorough with no ambiguities.
-
-        Return valid JSON only with no extra text or formatting.
-    """)
-    prompt = dedent(f"""
-        {custom_instructions}
-    
-        Analyze the following feature and provide a comprehensive evaluation in valid JSON.
-        The user does NOT want to display raw JSON on screen, only final visuals.
-        Also provide any clarifying questions you'd like to ask the user as a JSON array named "clarifying_questions".
-    
-        Feature Details:
-        {json.dumps(feature_data, indent=2)}
-    
-        Mandatory JSON Structure:
-        {{
-          "rice_scores": {{
-            "Reach": {{"value": int, "reason": string}},
-            "Impact": {{"value": int, "reason": string}},
-            "Confidence": {{"value": int, "reason": string}},
-            "Effort": {{"value": int, "reason": string}},
-            "final_rice_score": float
-          }},
-          "moscow_priority": {{
-            "category": string,
-            "justification": string
-          }},
-          "risks": {{
-            "technical_complexity": string,
-            "business_model": string,
-            "adoption": string,
-            "competition": string
-          }},
-          "business_value": {{
-            "revenue_potential": string,
-            "cost_savings": string,
-            "market_positioning": string
-          }},
-          "implementation": {{
-            "complexity": string,
-            "dependencies": string,
-            "timeline": string
-          }},
-          "mvp_recommendation": string,
-          "roadmap": [
-              {{
-                  "Phase": string,
-                  "Timeline": string,
-                  "Milestone": string,
-                  "Success Metric": string
-              }}
-          ],
-          "industry_specific_considerations": string,
-          "recommended_monetization": string,
-          "overall_confidence": float,
-          "confidence_improvement_areas": {{
-              "Market Understanding": string,
-              "Technical Feasibility": string,
-              "Business Impact": string,
-              "Implementation Clarity": string
-          }},
-          "swot_analysis": {{
-            "Strengths": string,
-            "Weaknesses": string,
-            "Opportunities": string,
-            "Threats": string
-          }},
-          "assumption_line": string,
-          "clarifying_questions": [string, string, ...]
-        }}
-    """)
-    if not openai.api_key:
+    from dotenv import load_dotenv
+    from openai import OpenAI
+
+    load_dotenv()
+    api_key = os.getenv("OPENAI_API_KEY", "")
+    if not api_key:
+        return None
+    return OpenAI(
+        api_key=api_key,
+        max_retries=0,  # retries are handled by _api_retry
+        http_client=httpx.Client(
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            timeout=HTTP_TIMEOUT
+        )
+    )
+
+def _async_openai_client(api_key: str, max_connections: int) -> "AsyncOpenAI":
+    """
+    Opens an AsyncOpenAI client for one asyncio.run. httpx async pools are bound to the
+    event loop that opened them, so this can't live in st.cache_resource; over HTTP/2 the
+    concurrent calls of a run are multiplexed on a single TLS connection.
+    """
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(
+        api_key=api_key,
+        max_retries=0,
+        http_client=httpx.AsyncClient(
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=HTTP_TIMEOUT
+        )
+    )
+
+# Unlike beta.py, 5xx responses are retried too: every section must come back for the analysis to render.
+def _is_transient_api_error(exc: BaseException) -> bool:
+    from openai import APIConnectionError, APIStatusError, RateLimitError
+
+    if isinstance(exc, (RateLimitError, APIConnectionError)):
+        return True
+    return isinstance(exc, APIStatusError) and exc.status_code >= 500
+
+_backoff = jittered_backoff(multiplier=1, max_wait=10)
+
+def _retry_wait(retry_state) -> float:
+    """
+    Honours the server's retry-after header on 429s, else backs off exponentially with jitter.
+    """
+    from openai import RateLimitError
+
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, RateLimitError):
+        try:
+            return float(exc.response.headers.get("retry-after"))
+        except (TypeError, ValueError):
+            pass
+    return _backoff(retry_state)
+
+# Shared by every completion call site (live sections and the multi-feature fan-out).
+_api_retry = retry(
+    wait=_retry_wait,
+    stop=stop_after_attempt(4),
+    retry=retry_if_exception(_is_transient_api_error),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+
+@_api_retry
+async def _aparse_completion(client: "AsyncOpenAI", **kwargs):
+    # Parses the response into the `response_format` model (Structured Outputs).
+    return await client.beta.chat.completions.parse(**kwargs)
+
+@st.cache_resource
+def _analysis_store() -> dict:
+    """
+    Finished analyses keyed by serialized feature data (streaming can't use st.cache_data).
+    """
+    return {}
+
+def _remember_analysis(key: str, analysis: dict, loaded_at: float):
+    store = _analysis_store()
+    store.pop(key, None)
+    store[key] = (analysis, loaded_at)
+    # Dicts keep insertion order, so the first keys are the least recently stored.
+    while len(store) > ANALYSIS_CACHE_MAX_ENTRIES:
+        store.pop(next(iter(store)), None)
+
+def _normalize_feature(feature_data: dict) -> dict:
+    return {k: str(v).strip().lower() for k, v in feature_data.items()}
+
+_DEFAULT_FEATURE_NORMALIZED = _normalize_feature(_DEFAULT_FEATURE)
+
+def _analysis_cache_key(feature_data: dict, model: str = GPT_MODEL) -> str:
+    """
+    Hashes the normalized inputs together with the model settings that shape the output.
+    """
+    normalized = _normalize_feature(feature_data)
+    normalized["_model"] = model
+    normalized["_temperature"] = GPT_TEMPERATURE
+    payload = orjson.dumps(normalized, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def _disk_cache_get(key: str):
+    try:
+        with closing(sqlite3.connect(ANALYSIS_CACHE_DB)) as conn:
+            row = conn.execute(
+                "SELECT analysis, created_at FROM analyses WHERE key = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row and time.time() - row[1] < ANALYSIS_DISK_TTL:
+        return orjson.loads(row[0]), row[1]
+    return None
+
+def _disk_cache_get_many(keys: list) -> dict:
+    """
+    Fresh analyses for any of `keys`, read over one connection; missing keys are absent.
+    """
+    cutoff = time.time() - ANALYSIS_DISK_TTL
+    found = {}
+    try:
+        with closing(sqlite3.connect(ANALYSIS_CACHE_DB)) as conn:
+            # Chunked to stay under SQLite's bound-parameter limit.
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = conn.execute(
+                    f"SELECT key, analysis FROM analyses WHERE created_at >= ? AND key IN ({','.join('?' * len(chunk))})",
+                    (cutoff, *chunk)
+                ).fetchall()
+                found.update((key, orjson.loads(analysis)) for key, analysis in rows)
+    except sqlite3.Error:
+        pass
+    return found
+
+def _disk_cache_set(key: str, analysis: dict, created_at: float):
+    try:
+        with closing(sqlite3.connect(ANALYSIS_CACHE_DB)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS analyses "
+                "(key TEXT PRIMARY KEY, analysis TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO analyses VALUES (?, ?, ?)",
+                (key, orjson.dumps(analysis).decode("utf-8"), created_at)
+            )
+            # Expired rows are never read again, so pruning them bounds the file size.
+            conn.execute("DELETE FROM analyses WHERE created_at < ?", (created_at - ANALYSIS_DISK_TTL,))
+    except sqlite3.Error as exc:
+        logger.warning("Analysis cache write failed: %s", exc)
+
+def get_cached_analysis(feature_data: dict, key: str = None):
+    """
+    Returns a cached analysis, checking memory (ANALYSIS_CACHE_TTL since last load)
+    then disk (ANALYSIS_DISK_TTL since it was generated).
+    """
+    key = key or _analysis_cache_key(feature_data)
+    store = _analysis_store()
+    entry = store.get(key)
+    if entry is not None and time.time() - entry[1] < ANALYSIS_CACHE_TTL:
+        return entry[0]
+    store.pop(key, None)
+    entry = _disk_cache_get(key)
+    if entry is None:
+        return None
+    _remember_analysis(key, entry[0], time.time())
+    return entry[0]
+
+def cache_analysis(feature_data: dict, analysis: dict, key: str = None):
+    """
+    Writes an analysis through to the in-memory store and the SQLite cache.
+    """
+    key = key or _analysis_cache_key(feature_data)
+    created_at = time.time()
+    _remember_analysis(key, analysis, created_at)
+    _disk_cache_set(key, analysis, created_at)
+
+def invalidate_cached_analysis(feature_data: dict, model: str = GPT_MODEL):
+    """
+    Drops any cached analysis for `feature_data` from memory and disk (Force Refresh).
+    """
+    key = _analysis_cache_key(feature_data, model)
+    _analysis_store().pop(key, None)
+    try:
+        with closing(sqlite3.connect(ANALYSIS_CACHE_DB)) as conn, conn:
+            conn.execute("DELETE FROM analyses WHERE key = ?", (key,))
+    except sqlite3.Error as exc:
+        logger.warning("Analysis cache delete failed: %s", exc)
+
+class SemanticCache:
+    """
+    Maps a feature's embedding to the cache key of an earlier analysis of a near-identical
+    feature. Entries are grouped by scope (exact industry and business model), and vectors
+    are stored unit-normalized as float32, so cosine similarity against every candidate is
+    one matrix-vector product. Persisted in the SQLite cache file; entries expire with the
+    analyses they point to (ANALYSIS_DISK_TTL).
+    """
+
+    def __init__(self, db_path: str):
+        import numpy as np
+
+        self.db_path = db_path
+        # scope -> (keys, created_at per key, matrix); each tuple is replaced, never mutated.
+        self.scopes = {}
+        self._lock = threading.Lock()
+        try:
+            with closing(sqlite3.connect(db_path)) as conn, conn:
+                # Leftover from the earlier single-table layout; nothing reads it any more.
+                conn.execute("DROP TABLE IF EXISTS semantic_index")
+                rows = conn.execute(
+                    "SELECT key, scope, vector, created_at FROM semantic_entries WHERE created_at >= ?",
+                    (time.time() - ANALYSIS_DISK_TTL,)
+                ).fetchall()
+        except sqlite3.Error:
+            rows = []
+        grouped = {}
+        for key, scope, vector, created_at in rows:
+            grouped.setdefault(scope, []).append((key, created_at, np.frombuffer(vector, dtype=np.float32)))
+        for scope, entries in grouped.items():
+            self.scopes[scope] = (
+                [key for key, _, _ in entries],
+                [created_at for _, created_at, _ in entries],
+                np.vstack([vector for _, _, vector in entries])
+            )
+
+    def nearest(self, scope: str, vector):
+        """
+        Returns (key, similarity) of the closest entry in `scope`, or (None, 0.0) when it has none.
+        """
+        entry = self.scopes.get(scope)
+        if entry is None:
+            return None, 0.0
+        keys, _, matrix = entry
+        sims = matrix @ vector
+        best = int(sims.argmax())
+        return keys[best], float(sims[best])
+
+    def add(self, key: str, scope: str, vector):
+        import numpy as np
+
+        now = time.time()
+        with self._lock:
+            keys, created, matrix = self.scopes.get(scope, ([], [], None))
+            if key in keys:
+                return
+            # Drop entries whose analyses have left the disk cache before appending.
+            live = [i for i, created_at in enumerate(created) if now - created_at < ANALYSIS_DISK_TTL]
+            keys = [keys[i] for i in live] + [key]
+            created = [created[i] for i in live] + [now]
+            matrix = np.vstack([matrix[live], vector]) if live else vector[None, :]
+            self.scopes[scope] = (keys, created, matrix)
+            try:
+                with closing(sqlite3.connect(self.db_path)) as conn, conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS semantic_entries "
+                        "(key TEXT PRIMARY KEY, scope TEXT NOT NULL, vector BLOB NOT NULL, created_at REAL NOT NULL)"
+                    )
+                    conn.execute(
+                        "INSERT OR REPLACE INTO semantic_entries VALUES (?, ?, ?, ?)",
+                        (key, scope, vector.tobytes(), now)
+                    )
+                    conn.execute("DELETE FROM semantic_entries WHERE created_at < ?", (now - ANALYSIS_DISK_TTL,))
+            except sqlite3.Error as exc:
+                logger.warning("Semantic cache write failed: %s", exc)
+
+    def discard(self, key: str, scope: str):
+        """
+        Forgets `key`, e.g. once its analysis is no longer in the exact cache.
+        """
+        with self._lock:
+            keys, created, matrix = self.scopes.get(scope, ([], [], None))
+            if key not in keys:
+                return
+            live = [i for i, k in enumerate(keys) if k != key]
+            if live:
+                self.scopes[scope] = ([keys[i] for i in live], [created[i] for i in live], matrix[live])
+            else:
+                del self.scopes[scope]
+            try:
+                with closing(sqlite3.connect(self.db_path)) as conn, conn:
+                    conn.execute("DELETE FROM semantic_entries WHERE key = ?", (key,))
+            except sqlite3.Error as exc:
+                logger.warning("Semantic cache delete failed: %s", exc)
+
+@st.cache_resource
+def _semantic_cache() -> SemanticCache:
+    return SemanticCache(ANALYSIS_CACHE_DB)
+
+@st.cache_resource
+def _embedding_executor():
+    """
+    Runs the blocking embeddings calls. Not the loop's default executor: asyncio.run joins
+    that on exit, so an embedding stuck past ANALYSIS_DEADLINE would hold up the run.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="embed")
+
+def _semantic_scope(feature_data: dict) -> str:
+    """
+    The categorical fields a semantic match must share exactly.
+    """
+    return "|".join(str(feature_data.get(field, "")).strip().lower() for field in _SEMANTIC_SCOPE_FIELDS)
+
+def _embed_feature(client: "OpenAI", feature_data: dict):
+    """
+    Embeds the free-text feature fields as one normalized string; returns a unit float32 vector.
+    """
+    import numpy as np
+
+    # Clarifications only join the text when present, so plain features embed as before.
+    fields = _SEMANTIC_TEXT_FIELDS + ("clarifications",) if feature_data.get("clarifications") else _SEMANTIC_TEXT_FIELDS
+    text = "|".join(str(feature_data.get(field, "")).strip().lower() for field in fields)
+    response = client.embeddings.create(model=SEMANTIC_CACHE_MODEL, input=text)
+    vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+def build_analysis_messages(feature_data: dict, section: str = None) -> list:
+    """
+    Constructs the detailed system + user prompt for a single feature analysis.
+    With `section`, only that part of the analysis (see ANALYSIS_SECTIONS) is requested.
+    """
+    scope = "a comprehensive evaluation" if section is None else ANALYSIS_SECTIONS[section][0]
+    prompt = _PROMPT_TPL.substitute(
+        rubric=_CONFIDENCE_RUBRIC if section in (None, "clarifying") else "",
+        scope=scope,
+        # Compact (indentation only costs tokens); numpy scalars serialize natively instead of raising.
+        feature_details=orjson.dumps(feature_data, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+    )
+    return [
+        {"role": "system", "content": _SYSTEM_MESSAGE},
+        {"role": "user", "content": prompt}
+    ]
+
+def parse_partial_rice_scores(buffer: str) -> dict:
+    """
+    Pulls RICE values out of a still-streaming (invalid) JSON buffer.
+    Only numbers followed by a delimiter are returned, so a value is never half-read.
+    """
+    scores = {comp: value for comp, value in _PARTIAL_RICE_RE.findall(buffer)}
+    final_score = _PARTIAL_FINAL_RICE_RE.search(buffer)
+    if final_score:
+        scores["RICE Score"] = final_score.group(1)
+    return scores
+
+@_api_retry
+async def _stream_section(client: "AsyncOpenAI", feature_data: dict, placeholder, model: str) -> dict:
+    with placeholder.container():
+        scores_slot = st.empty()
+        raw_slot = st.empty()
+    shown_scores = {}
+    async with client.beta.chat.completions.stream(
+        model=model,
+        messages=build_analysis_messages(feature_data, "scores"),
+        temperature=GPT_TEMPERATURE,
+        max_tokens=GPT_SECTION_MAX_TOKENS,
+        top_p=1.0,
+        seed=GPT_SEED,
+        response_format=ScoresSection
+    ) as stream:
+        async for event in stream:
+            if event.type != "content.delta":
+                continue
+            # RICE scores lead the section, so show them as soon as their values close.
+            scores = parse_partial_rice_scores(event.snapshot)
+            if scores != shown_scores:
+                shown_scores = scores
+                scores_slot.markdown(" · ".join(f"**{k}**: {v}" for k, v in scores.items()))
+            raw_slot.code(event.snapshot, language="json")
+        completion = await stream.get_final_completion()
+    return completion.choices[0].message.parsed.model_dump(by_alias=True)
+
+async def _request_section(client: "AsyncOpenAI", feature_data: dict, section: str, model: str) -> dict:
+    response = await _aparse_completion(
+        client,
+        model=model,
+        messages=build_analysis_messages(feature_data, section),
+        temperature=GPT_TEMPERATURE,
+        max_tokens=GPT_SECTION_MAX_TOKENS,
+        top_p=1.0,
+        seed=GPT_SEED,
+        response_format=ANALYSIS_SECTIONS[section][1]
+    )
+    return response.choices[0].message.parsed.model_dump(by_alias=True)
+
+async def _analyze_sections(api_key: str, feature_data: dict, placeholder=None, model: str = GPT_MODEL) -> dict:
+    # One pooled client per run: its connections are shared by every section call.
+    async with _async_openai_client(api_key, SECTION_MAX_CONNECTIONS) as client:
+        calls = [
+            _stream_section(client, feature_data, placeholder, model)
+            if section == "scores" and placeholder is not None
+            else _request_section(client, feature_data, section, model)
+            for section in ANALYSIS_SECTIONS
+        ]
+        results = await asyncio.gather(*calls)
+    analysis = {}
+    for result in results:
+        analysis.update(result)
+    return analysis
+
+async def _analyze_or_reuse(client: "OpenAI", feature_data: dict, placeholder, model: str, scope: str = None):
+    """
+    Runs _analyze_sections; with a semantic `scope`, embeds the feature alongside it and, when a
+    cached analysis of a near-identical feature turns up, cancels the run and returns that instead.
+    Returns (analysis, vector, reused); vector is None when the lookup was skipped or failed.
+    """
+    analysis_task = asyncio.create_task(_analyze_sections(client.api_key, feature_data, placeholder, model))
+    vector = None
+    if scope is not None:
+        try:
+            # The embeddings call is blocking; a worker thread keeps it off the section requests.
+            vector = await asyncio.get_running_loop().run_in_executor(
+                _embedding_executor(), _embed_feature, client, feature_data
+            )
+            match_key, similarity = _semantic_cache().nearest(scope, vector)
+            if similarity >= SEMANTIC_CACHE_THRESHOLD:
+                match = get_cached_analysis({}, key=match_key)
+                if match is not None:
+                    logger.info("Semantic cache hit (%.3f)", similarity)
+                    analysis_task.cancel()
+                    # Let the cancelled run close its client before the loop shuts down.
+                    await asyncio.gather(analysis_task, return_exceptions=True)
+                    return match, None, True
+                _semantic_cache().discard(match_key, scope)
+        except Exception as exc:
+            logger.warning("Semantic cache lookup failed: %s", exc)
+    return await analysis_task, vector, False
+
+def generate_visual_analysis(feature_data: dict, placeholder=None, semantic: bool = True, model: str = GPT_MODEL) -> dict:
+    """
+    Requests each analysis section from `model` concurrently and merges them into one dict.
+    The scores section is streamed into `placeholder` as it arrives.
+    With `semantic`, a cached analysis of a near-identical feature is reused instead, and
+    the default scenario returns the bundled snapshot; Force Refresh passes False.
+    """
+    key = _analysis_cache_key(feature_data, model)
+    # The snapshot and the semantic index only hold default-model analyses.
+    semantic = semantic and model == GPT_MODEL
+    if semantic and _normalize_feature(feature_data) == _DEFAULT_FEATURE_NORMALIZED:
+        snapshot = default_analysis()
+        if snapshot is not None:
+            return snapshot
+    cached = get_cached_analysis(feature_data, key=key)
+    if cached is not None:
+        return cached
+
+    client = get_openai_client()
+    if client is None:
         return {}
+    scope = _semantic_scope(feature_data) if semantic else None
     try:
-        response = openai.ChatCompletion.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.1,
-            max_tokens=3000,
-            top_p=1.0
-        )
-        return json.loads(response.choices[0].message.content.strip())
+        # HTTP_TIMEOUT bounds each read, not a slow stream plus retries; this bounds the whole run,
+        # semantic lookup included.
+        analysis, vector, reused = asyncio.run(asyncio.wait_for(
+            _analyze_or_reuse(client, feature_data, placeholder, model, scope), ANALYSIS_DEADLINE
+        ))
+    except asyncio.TimeoutError:
+        logger.warning("Analysis did not finish within %ss", ANALYSIS_DEADLINE)
+        return {}
     except Exception as exc:
-        logger.warning(f"GPT call failed: {exc}")
+        logger.warning("GPT call failed: %s", exc)
         return {}
+    finally:
+        # The user only wants the final visuals, so drop the raw stream once done.
+        if placeholder is not None:
+            placeholder.empty()
+    if reused:
+        # Not written under this feature's exact key: the match is an approximation.
+        return analysis
+    cache_analysis(feature_data, analysis, key=key)
+    if vector is not None:
+        _semantic_cache().add(key, scope, vector)
+    return analysis
+
+def regenerate_default_analysis() -> dict:
+    """
+    Re-analyzes _DEFAULT_FEATURE against the live API and rewrites default_analysis.json.
+    Run after changing the prompt or schema (needs OPENAI_API_KEY):
+        python -c "import featurefit; featurefit.regenerate_default_analysis()"
+    """
+    invalidate_cached_analysis(_DEFAULT_FEATURE)
+    analysis = generate_visual_analysis(_DEFAULT_FEATURE, semantic=False)
+    if not analysis:
+        raise RuntimeError("Analysis of the default feature failed; default_analysis.json left unchanged")
+    analysis = Analysis.model_validate(analysis).model_dump(by_alias=True)
+    with open(_DEFAULT_ANALYSIS_PATH, "wb") as snapshot:
+        snapshot.write(orjson.dumps(analysis, option=orjson.OPT_INDENT_2) + b"\n")
+    default_analysis.clear()
+    return analysis
+
+# -----------------------------------------------------------------------------
+# CONCURRENT ANALYSIS (Multi-feature fan-out with AsyncOpenAI)
+# -----------------------------------------------------------------------------
+async def _analyze_one(client: "AsyncOpenAI", semaphore: asyncio.Semaphore, feature_data: dict) -> dict:
+    cached = get_cached_analysis(feature_data)
+    if cached is not None:
+        return cached
+    try:
+        async with semaphore:
+            response = await _aparse_completion(
+                client,
+                model=GPT_MODEL,
+                messages=build_analysis_messages(feature_data),
+                temperature=GPT_TEMPERATURE,
+                max_tokens=GPT_MAX_TOKENS,
+                top_p=1.0,
+                seed=GPT_SEED,
+                response_format=Analysis
+            )
+        analysis = response.choices[0].message.parsed.model_dump(by_alias=True)
+    except Exception as exc:
+        logger.warning("GPT call failed for %s: %s", feature_data.get('feature_name'), exc)
+        return {}
+    cache_analysis(feature_data, analysis)
+    return analysis
+
+async def _analyze_many(feature_list: list) -> list:
+    api_key = get_openai_client().api_key
+    async with _async_openai_client(api_key, 20) as client:
+        semaphore = asyncio.Semaphore(ANALYSIS_CONCURRENCY)
+        return await asyncio.gather(
+            *[_analyze_one(client, semaphore, feature_data) for feature_data in feature_list]
+        )
+
+def analyze_many(feature_list: list) -> list:
+    """
+    Analyzes several features concurrently (at most ANALYSIS_CONCURRENCY in flight).
+    Returns one analysis dict per feature, in order; failed analyses come back empty.
+    """
+    if get_openai_client() is None:
+        return [{} for _ in feature_list]
+    return asyncio.run(_analyze_many(feature_list))
+
+# -----------------------------------------------------------------------------
+# BATCH ANALYSIS (Offline cache warming via the OpenAI Batch API)
+# -----------------------------------------------------------------------------
+def generate_analysis_batch(feature_list: list) -> str:
+    """
+    Submits one chat completion per feature to the Batch API (50% cheaper, up to 24h).
+    Each request's custom_id is its cache key; returns the batch id for later collection.
+    """
+    requests_by_key = {}
+    for feature_data in feature_list:
+        key = _analysis_cache_key(feature_data)
+        requests_by_key[key] = {
+            "custom_id": key,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": GPT_MODEL,
+                "messages": build_analysis_messages(feature_data),
+                "temperature": GPT_TEMPERATURE,
+                "max_tokens": GPT_MAX_TOKENS,
+                "top_p": 1.0,
+                "seed": GPT_SEED,
+                "response_format": ANALYSIS_RESPONSE_FORMAT
+            }
+        }
+    jsonl = b"\n".join(orjson.dumps(request) for request in requests_by_key.values())
+    client = get_openai_client()
+    if client is None:
+        raise RuntimeError("OPENAI_API_KEY is not configured")
+    batch_file = client.files.create(
+        file=("featurefit_batch.jsonl", jsonl),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    logger.info("Submitted analysis batch %s with %s requests", batch.id, len(requests_by_key))
+    _record_batch_features(batch.id, feature_list)
+    return batch.id
+
+def _record_batch_features(batch_id: str, feature_list: list):
+    try:
+        with closing(sqlite3.connect(ANALYSIS_CACHE_DB)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS batches "
+                "(batch_id TEXT PRIMARY KEY, features TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO batches VALUES (?, ?, ?)",
+                (batch_id, orjson.dumps(feature_list, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8"), time.time())
+            )
+    except sqlite3.Error as exc:
+        logger.warning("Batch record write failed: %s", exc)
+
+def get_batch_features(batch_id: str) -> list:
+    """
+    Returns the feature list a batch was submitted with (empty if unknown).
+    """
+    try:
+        with closing(sqlite3.connect(ANALYSIS_CACHE_DB)) as conn:
+            row = conn.execute(
+                "SELECT features FROM batches WHERE batch_id = ?", (batch_id,)
+            ).fetchone()
+    except sqlite3.Error:
+        return []
+    return orjson.loads(row[0]) if row else []
+
+def collect_analysis_batch(batch_id: str):
+    """
+    Checks a submitted batch once. When it has completed, every successful result is
+    upserted into the analysis cache and the number stored is returned; otherwise
+    returns the batch's current status string. A completed batch whose every request
+    failed has no output file and returns 0.
+    """
+    client = get_openai_client()
+    batch = client.batches.retrieve(batch_id)
+    if batch.status != "completed":
+        return batch.status
+    if not batch.output_file_id:
+        logger.warning("Batch %s completed with no output (error file %s)", batch_id, batch.error_file_id)
+        return 0
+    stored = 0
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        result = orjson.loads(line)
+        response = result.get("response") or {}
+        if result.get("error") or response.get("status_code") != 200:
+            continue
+        try:
+            content = response["body"]["choices"][0]["message"]["content"]
+            analysis = Analysis.model_validate_json(content).model_dump(by_alias=True)
+            cache_analysis({}, analysis, key=result["custom_id"])
+            stored += 1
+        except (KeyError, IndexError, ValueError) as exc:
+            logger.warning("Skipping batch result %s: %s", result.get('custom_id'), exc)
+    logger.info("Collected %s analyses from batch %s", stored, batch_id)
+    return stored
+
+def wait_for_analysis_batch(batch_id: str, poll_interval: float = 60.0, max_interval: float = 900.0) -> int:
+    """
+    Blocks until the batch finishes (for offline/overnight scripts, not the UI).
+    The wait between polls doubles from `poll_interval` up to `max_interval`.
+    """
+    while True:
+        result = collect_analysis_batch(batch_id)
+        if isinstance(result, int):
+            return result
+        if result in ("failed", "expired", "cancelled"):
+            logger.warning("Analysis batch %s ended with status %s", batch_id, result)
+            return 0
+        time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 2, max_interval)
+
+def warm_cache_feature_list(feature_name: str, business_goal: str, context: str) -> list:
+    """
+    Builds the industry x business model grid for the given feature inputs.
+    """
+    return [
+        {
+            "feature_name": feature_name,
+            "industry": industry,
+            "business_goal": business_goal,
+            "business_model": business_model,
+            "context": context
+        }
+        for industry in _INDUSTRIES if industry != "Custom"
+        for business_model in _BUSINESS_MODELS
+    ]
+
+def parse_feature_csv(data: bytes) -> list:
+    """
+    Reads one feature per CSV row. Headers are matched to _CSV_FIELDS case-insensitively
+    (spaces allowed); missing columns are left blank and rows without a name are skipped.
+    """
+    reader = csv.DictReader(io.StringIO(data.decode("utf-8-sig")))
+    features = []
+    for row in reader:
+        normalized = {
+            (header or "").strip().lower().replace(" ", "_"): (value or "").strip()
+            for header, value in row.items()
+        }
+        if normalized.get("feature_name"):
+            features.append({field: normalized.get(field, "") for field in _CSV_FIELDS})
+    return features
 
 # -----------------------------------------------------------------------------
 # GENERATE PDF FUNCTION (Coming Soon placeholder)
@@ -240,101 +1112,121 @@ def generate_pdf(analysis_data: dict) -> bytes:
 # -----------------------------------------------------------------------------
 # DISPLAY ANALYSIS FUNCTION
 # -----------------------------------------------------------------------------
+@st.cache_data
+def _rice_figures(r_vals: tuple):
+    """
+    Builds the RICE radar and bar figures; memoized on the score tuple across reruns.
+    """
+    import plotly.graph_objects as go
+
+    # RICE Radar Chart (closed by repeating the first point)
+    radar_fig = go.Figure(go.Scatterpolar(
+        r=r_vals + r_vals[:1],
+        theta=_RICE_COMPONENTS + _RICE_COMPONENTS[:1],
+        mode="lines",
+        line_color="#ffcc00"
+    ))
+    radar_fig.update_layout(template="plotly_dark", title="RICE Radar")
+    # RICE Bar Chart with Effort annotation ("Lower is better")
+    bar_fig = go.Figure(go.Bar(
+        x=_RICE_COMPONENTS,
+        y=r_vals,
+        marker_color=_RICE_BAR_COLORS,
+        text=r_vals,
+        textposition="outside",
+        textangle=0,
+        textfont_size=12
+    ))
+    bar_fig.update_layout(title="RICE Components", xaxis_title="Component", yaxis_title="Score")
+    bar_fig.add_annotation(
+        x="Effort",
+        y=r_vals[3] + 5,
+        text="Lower is better",
+        showarrow=False,
+        font=dict(color="#ffcc00", size=12)
+    )
+    return radar_fig, bar_fig
+
+@st.cache_data
+def _rice_dashboard(r_vals: tuple):
+    """
+    Radar and bar traces side by side in one figure, so the page mounts a single chart.
+    """
+    from plotly.subplots import make_subplots
+
+    radar_fig, bar_fig = _rice_figures(r_vals)
+    fig = make_subplots(
+        rows=1, cols=2,
+        specs=[[{"type": "polar"}, {"type": "xy"}]],
+        subplot_titles=("RICE Radar", "RICE Components")
+    )
+    fig.add_trace(radar_fig.data[0], row=1, col=1)
+    fig.add_trace(bar_fig.data[0], row=1, col=2)
+    fig.update_xaxes(title_text="Component", row=1, col=2)
+    fig.update_yaxes(title_text="Score", row=1, col=2)
+    fig.add_annotation(bar_fig.layout.annotations[0], row=1, col=2)
+    fig.update_layout(template="plotly_dark", showlegend=False)
+    return fig
+
+@st.cache_data
+def _rice_chart_pngs(r_vals: tuple):
+    """
+    Renders the RICE figures to PNG bytes; Kaleido export dwarfs building the figures,
+    so it only runs when the scores change. The exports run one after the other:
+    Kaleido renders through a single browser process either way.
+    """
+    radar_fig, bar_fig = _rice_figures(r_vals)
+    return radar_fig.to_image(format="png", scale=2), bar_fig.to_image(format="png", scale=2)
+
+def export_rice_charts(analysis_data: dict):
+    """
+    Keeps the RICE chart PNGs in the session for the PDF export. Only runs when an export
+    is requested, since Kaleido starts a headless browser for the first image. Held in
+    memory rather than written to disk, so concurrent sessions never overwrite each other's.
+    """
+    rice_scores = analysis_data.get("rice_scores", {})
+    r_vals = tuple(rice_scores.get(comp, {}).get("value", 0) for comp in _RICE_COMPONENTS)
+    st.session_state["radar_png"], st.session_state["bar_png"] = _rice_chart_pngs(r_vals)
+
 def display_analysis(analysis_data: dict):
     # Extract RICE scores and values
     rice_scores = analysis_data.get("rice_scores", {})
-    r_vals = [
-        rice_scores.get("Reach", {}).get("value", 0),
-        rice_scores.get("Impact", {}).get("value", 0),
-        rice_scores.get("Confidence", {}).get("value", 0),
-        rice_scores.get("Effort", {}).get("value", 0)
-    ]
+    if not rice_scores:
+        # Nothing to chart: an all-zero radar and bar would only mislead.
+        st.error("Analysis failed or returned empty. Retry or reset.")
+        return
+    rice_parts = tuple(rice_scores.get(comp, {}) for comp in _RICE_COMPONENTS)
+    r_vals = tuple(part.get("value", 0) for part in rice_parts)
     
-    # Display charts side-by-side using two columns
-    col1, col2 = st.columns(2)
-    with col1:
-        # RICE Radar Chart
-        radar_data = pd.DataFrame({
-            "Metric": ["Reach", "Impact", "Confidence", "Effort"],
-            "Score": r_vals
-        })
-        radar_fig = px.line_polar(
-            radar_data,
-            r="Score",
-            theta="Metric",
-            line_close=True,
-            color_discrete_sequence=['#ffcc00'],
-            template="plotly_dark",
-            title="RICE Radar"
-        )
-        st.plotly_chart(radar_fig, use_container_width=True)
-    with col2:
-        # RICE Bar Chart with Effort annotation ("Lower is better")
-        bar_data = pd.DataFrame({
-            "Component": ["Reach", "Impact", "Confidence", "Effort"],
-            "Score": r_vals
-        })
-        bar_fig = px.bar(
-            bar_data,
-            x="Component",
-            y="Score",
-            color="Component",
-            color_discrete_sequence=['#00fa92','#b5838d','#ffae00','#00b8d9'],
-            text="Score",
-            title="RICE Components"
-        )
-        bar_fig.update_traces(textfont_size=12, textangle=0, textposition="outside")
-        try:
-            effort_value = bar_data.loc[bar_data["Component"] == "Effort", "Score"].iloc[0]
-            bar_fig.add_annotation(
-                x="Effort",
-                y=effort_value + 5,
-                text="Lower is better",
-                showarrow=False,
-                font=dict(color="#ffcc00", size=12)
-            )
-        except Exception:
-            pass
-        st.plotly_chart(bar_fig, use_container_width=True)
+    # Cheap text goes out before the Plotly figures, whose JSON is the slowest to serialize.
+    st.header("Visual Analysis")
     
-    # Save charts as PNGs for future PDF export (using Kaleido)
-    radar_fig.write_image("radar_chart.png", format="png", scale=2)
-    bar_fig.write_image("bar_chart.png", format="png", scale=2)
+    st.plotly_chart(_rice_dashboard(r_vals), use_container_width=True)
     
     # Display additional analysis details
-    st.header("Visual Analysis")
-    
     st.subheader("RICE Justifications")
-    justifications_list = []
-    for comp in ["Reach", "Impact", "Confidence", "Effort"]:
-        cinfo = rice_scores.get(comp, {})
-        cVal = cinfo.get("value", 0)
-        cReason = cinfo.get("reason", "No justification")
-        justifications_list.append({
-            "Component": comp,
-            "Value": cVal,
-            "Justification": cReason
-        })
-    st.table(pd.DataFrame(justifications_list))
+    # Four fixed rows: static HTML instead of st.table's Arrow serialization.
+    rows = "".join(
+        _JUSTIFICATION_ROW_TPL.substitute(
+            component=comp,
+            value=escape(str(value)),
+            reason=escape(str(part.get("reason", "No justification")))
+        )
+        for comp, part, value in zip(_RICE_COMPONENTS, rice_parts, r_vals)
+    )
+    st.markdown(_JUSTIFICATIONS_TABLE_TPL.substitute(rows=rows), unsafe_allow_html=True)
     
     st.subheader("MoSCoW Priority")
     moscow_priority = analysis_data.get("moscow_priority", {})
     category_raw = moscow_priority.get("category", "N/A")
     justification_txt = moscow_priority.get("justification", "")
-    cat_lower = category_raw.lower()
-    if "must" in cat_lower:
-        moscow_color = "#f25f5c"
-    elif "should" in cat_lower:
-        moscow_color = "#ffaa00"
-    elif "could" in cat_lower:
-        moscow_color = "#00fa92"
-    else:
-        moscow_color = "#94d0ff"
+    moscow_match = _MOSCOW_RE.search(category_raw)
+    moscow_color = _MOSCOW_COLORS[moscow_match.group(0).lower()] if moscow_match else _MOSCOW_DEFAULT_COLOR
     st.markdown(
-        f"<div style='font-size:1.1rem; color:{moscow_color};'><strong>{category_raw}</strong></div>",
+        _MOSCOW_TPL.substitute(color=moscow_color, category=escape(str(category_raw)))
+        + f"\n\n*Justification*: {escape(str(justification_txt))}",
         unsafe_allow_html=True
     )
-    st.markdown(f"*Justification*: {justification_txt}")
     
     st.subheader("Implementation Overview")
     implementation = analysis_data.get("implementation", {})
@@ -347,21 +1239,26 @@ def display_analysis(analysis_data: dict):
     
     st.subheader("Risk Assessment")
     risks = analysis_data.get("risks", {})
-    st.markdown(f"""
-- **Technical Complexity**: {risks.get('technical_complexity','N/A')}
-- **Business Model**: {risks.get('business_model','N/A')}
-- **Adoption**: {risks.get('adoption','N/A')}
-- **Competition**: {risks.get('competition','N/A')}
-    """)
+    st.markdown("\n".join(
+        f"- **{label}**: {risks.get(key, 'N/A')}" for key, label in _RISK_FIELDS
+    ))
     
     st.subheader("MVP Roadmap")
     mvp_recommendation = analysis_data.get("mvp_recommendation", "")
-    st.markdown(f"**Recommendation**: {mvp_recommendation}")
     roadmap = analysis_data.get("roadmap", [])
+    st.markdown(f"**Recommendation**: {mvp_recommendation}" + ("\n\n**Roadmap Phases**:" if roadmap else ""))
     if roadmap:
-        st.markdown("**Roadmap Phases**:")
-        roadmap_df = pd.DataFrame(roadmap)
-        st.dataframe(roadmap_df.style.background_gradient(cmap='Blues'), use_container_width=True)
+        # A few rows of text: plain HTML skips the DataFrame, Arrow and grid-component round trip.
+        rows = "".join(
+            _ROADMAP_ROW_TPL.substitute(
+                phase=escape(str(phase.get("Phase", ""))),
+                timeline=escape(str(phase.get("Timeline", ""))),
+                milestone=escape(str(phase.get("Milestone", ""))),
+                metric=escape(str(phase.get("Success Metric", "")))
+            )
+            for phase in roadmap
+        )
+        st.markdown(_ROADMAP_TABLE_TPL.substitute(rows=rows), unsafe_allow_html=True)
     else:
         st.info("No roadmap data provided.")
     
@@ -376,91 +1273,210 @@ def display_analysis(analysis_data: dict):
     st.subheader("Confidence Improvement Areas")
     confidence_improvements = analysis_data.get("confidence_improvement_areas", {})
     if confidence_improvements:
-        for k, v in confidence_improvements.items():
-            st.markdown(f"• **{k}**: {v}")
+        st.markdown("\n".join(f"- **{k}**: {v}" for k, v in confidence_improvements.items()))
     else:
         st.markdown("_No specific improvements provided._")
     
     st.subheader("SWOT Analysis")
     swot_analysis = analysis_data.get("swot_analysis", {})
-    strengths = swot_analysis.get("Strengths", "N/A")
-    weaknesses = swot_analysis.get("Weaknesses", "N/A")
-    opportunities = swot_analysis.get("Opportunities", "N/A")
-    threats = swot_analysis.get("Threats", "N/A")
-    swot_table = f"""
-    <style>
-        .swot-table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 1rem;
-        }}
-        .swot-table th, .swot-table td {{
-            border: 1px solid #3c3c3c;
-            padding: 8px;
-            text-align: left;
-        }}
-        .swot-table th {{
-            background-color: #00b8d9;
-            color: #ffffff;
-        }}
-        .swot-table td {{
-            background-color: #2f3142;
-            color: #ffffff;
-        }}
-        .swot-table .opportunities {{
-            background-color: #ffaa00;
-            color: #1d1f27;
-        }}
-        .swot-table .threats {{
-            background-color: #f25f5c;
-            color: #ffffff;
-        }}
-    </style>
-    <table class="swot-table">
-        <tr>
-            <th>Strengths</th>
-            <th>Weaknesses</th>
-        </tr>
-        <tr>
-            <td>{strengths}</td>
-            <td>{weaknesses}</td>
-        </tr>
-        <tr>
-            <th>Opportunities</th>
-            <th>Threats</th>
-        </tr>
-        <tr>
-            <td class="opportunities">{opportunities}</td>
-            <td class="threats">{threats}</td>
-        </tr>
-    </table>
+    st.markdown(
+        _SWOT_TABLE_TPL.substitute(
+            strengths=escape(str(swot_analysis.get("Strengths", "N/A"))),
+            weaknesses=escape(str(swot_analysis.get("Weaknesses", "N/A"))),
+            opportunities=escape(str(swot_analysis.get("Opportunities", "N/A"))),
+            threats=escape(str(swot_analysis.get("Threats", "N/A")))
+        ),
+        unsafe_allow_html=True
+    )
+
+# -----------------------------------------------------------------------------
+# ADMIN PANEL (Batch cache warming, enabled with FEATUREFIT_ADMIN=1)
+# -----------------------------------------------------------------------------
+def render_admin_panel():
+    with st.sidebar.expander("Admin: Warm Analysis Cache"):
+        feature_list = warm_cache_feature_list(
+            st.session_state["feature_name"],
+            st.session_state["business_goal"],
+            st.session_state["context"]
+        )
+        st.caption(
+            f"Submits {len(feature_list)} analyses (industry x business model) for the current "
+            "feature through the OpenAI Batch API. Results can take up to 24 hours."
+        )
+        if st.button("Submit Warm-up Batch"):
+            try:
+                st.session_state["warm_batch_id"] = generate_analysis_batch(feature_list)
+                st.success(f"Batch submitted: {st.session_state['warm_batch_id']}")
+            except Exception as exc:
+                logger.warning("Batch submission failed: %s", exc)
+                st.error("Batch submission failed. Check the logs for details.")
+        batch_id = st.session_state.get("warm_batch_id")
+        if batch_id and st.button("Collect Batch Results"):
+            try:
+                result = collect_analysis_batch(batch_id)
+            except Exception as exc:
+                logger.warning("Batch collection failed: %s", exc)
+                st.error("Could not check the batch. Check the logs for details.")
+            else:
+                if isinstance(result, int):
+                    st.success(f"Cached {result} analyses from batch {batch_id}.")
+                    st.session_state.pop("warm_batch_id", None)
+                else:
+                    st.info(f"Batch {batch_id} is still {result}.")
+
+# -----------------------------------------------------------------------------
+# BULK ANALYSIS (CSV upload through the OpenAI Batch API)
+# -----------------------------------------------------------------------------
+def _set_bulk_batch(batch_id):
+    st.session_state["bulk_batch_id"] = batch_id
+    if batch_id:
+        st.query_params["bulk_batch"] = batch_id
+    else:
+        st.query_params.pop("bulk_batch", None)
+
+def render_bulk_panel():
+    with st.sidebar.expander("Bulk Analyze (CSV)"):
+        st.caption(
+            f"One feature per row with columns: {', '.join(_CSV_FIELDS)}. "
+            "Runs through the OpenAI Batch API at half the cost; results can take up to 24 hours."
+        )
+        upload = st.file_uploader("Features CSV", type="csv")
+        if upload is not None and st.button("Submit Bulk Analysis"):
+            features = parse_feature_csv(upload.getvalue())
+            if not features:
+                st.warning("No rows with a feature_name were found in the CSV.")
+            else:
+                try:
+                    _set_bulk_batch(generate_analysis_batch(features))
+                    st.success(f"Submitted {len(features)} features.")
+                except Exception as exc:
+                    logger.warning("Bulk batch submission failed: %s", exc)
+                    st.error("Batch submission failed. Check the logs for details.")
+        batch_id = st.session_state.get("bulk_batch_id")
+        if batch_id:
+            st.caption(f"Current batch: {batch_id}")
+            if st.button("Check Bulk Results"):
+                try:
+                    result = collect_analysis_batch(batch_id)
+                except Exception as exc:
+                    logger.warning("Bulk batch collection failed: %s", exc)
+                    st.error("Could not check the batch. Check the logs for details.")
+                else:
+                    if isinstance(result, int):
+                        _load_bulk_results.clear()
+                        st.success(f"Collected {result} analyses.")
+                    else:
+                        st.info(f"Batch is still {result}.")
+            if st.button("Clear Bulk Batch"):
+                _set_bulk_batch(None)
+
+@st.cache_data(ttl=ANALYSIS_CACHE_TTL, show_spinner=False)
+def _load_bulk_results(batch_id: str) -> list:
+    """
+    (feature_data, analysis) pairs for the collected features of a bulk batch.
+    Read straight from disk in one query and cached per batch id, so reruns neither
+    re-query every row nor push interactive analyses out of the in-memory store.
+    Cleared when a batch is collected.
+    """
+    features = get_batch_features(batch_id)
+    keys = [_analysis_cache_key(feature_data) for feature_data in features]
+    found = _disk_cache_get_many(keys)
+    return [(feature_data, found[key]) for feature_data, key in zip(features, keys) if key in found]
+
+def render_bulk_results():
+    """
+    Shows a card per bulk feature whose analysis is cached; a card can be opened
+    as the main analysis.
+    """
+    batch_id = st.session_state.get("bulk_batch_id")
+    if not batch_id:
+        return
+    results = _load_bulk_results(batch_id)
+    if not results:
+        return
+    st.header("Bulk Analysis Results")
+    columns = st.columns(3)
+    for i, (feature_data, analysis) in enumerate(results):
+        with columns[i % 3].container(border=True):
+            st.markdown(f"**{feature_data['feature_name']}**")
+            st.caption(f"{feature_data['industry']} · {feature_data['business_model']}")
+            st.metric("RICE Score", analysis.get("rice_scores", {}).get("final_rice_score", "N/A"))
+            st.write(analysis.get("moscow_priority", {}).get("category", "N/A"))
+            if st.button("View Analysis", key=f"bulk_view_{i}"):
+                st.session_state["analysis_data"] = analysis
+                st.session_state["analysis_key"] = _analysis_cache_key(feature_data)
+
+# -----------------------------------------------------------------------------
+# FEATURE INPUTS
+# -----------------------------------------------------------------------------
+def session_feature_data() -> dict:
+    """
+    The feature as configured in the form. Clarifying answers travel as their own field
+    rather than being appended to the context, so the form and the clarifications
+    re-analysis build the same dict (and cache key) for the same inputs.
+    """
+    feature_data = {
+        "feature_name": st.session_state["feature_name"],
+        "industry": st.session_state["industry"],
+        "business_goal": st.session_state["business_goal"],
+        "business_model": st.session_state["business_model"],
+        "context": st.session_state.get("context", _DEFAULT_FEATURE["context"])
+    }
+    if st.session_state["clarifications"]:
+        feature_data["clarifications"] = st.session_state["clarifications"]
+    return feature_data
+
+# -----------------------------------------------------------------------------
+# SIDEBAR EXTRAS
+# -----------------------------------------------------------------------------
+# st.fragment is 1.37+; 1.33-1.36 (the requirements.txt floor) ship it as st.experimental_fragment.
+_fragment = getattr(st, "fragment", None) or st.experimental_fragment
+
+@_fragment
+def render_extra_features():
+    """
+    Sidebar extras. As a fragment, its buttons and the feedback box rerun only this block,
+    not the form and the rendered analysis.
     """
-    st.markdown(swot_table, unsafe_allow_html=True)
+    st.markdown("### Extra Features")
+    if st.button("Export Analysis to PDF"):
+        if st.session_state.get("analysis_data"):
+            export_rice_charts(st.session_state["analysis_data"])
+        st.info("Export Analysis to PDF: Coming Soon!")
+    if st.button("Collaboration Mode"):
+        st.info("Collaboration Mode activated! Share your analysis with your team.")
+    st.text_input("Feedback (Rate GPT's accuracy):", "")
+    if st.button("Submit Feedback"):
+        st.success("Feedback submitted. Thanks for your input!")
 
 # -----------------------------------------------------------------------------
 # MAIN APPLICATION
 # -----------------------------------------------------------------------------
 def main():
     inject_custom_css()  # Inject custom CSS
+    # Main-body slot for the clarification re-analysis, which is triggered from the sidebar
+    # but should stream where the form's analysis does; an unused st.empty() renders nothing.
+    reanalysis_slot = st.empty()
     
     # -----------------------------------------------------------------------------
     # Sidebar: About, Confidence, Clarifying Questions, Reset, Extras
     # -----------------------------------------------------------------------------
     st.sidebar.markdown("## 🤖 About")
     st.sidebar.info("Evaluate your feature ideas fast with AI-powered insights. Use the form below and receive clarifying questions from GPT in the sidebar after analysis.")
+    st.sidebar.selectbox(
+        "Model",
+        GPT_MODEL_CHOICES,
+        key="gpt_model",
+        help="gpt-4o-mini is fastest and cheapest; gpt-4o gives more thorough analyses."
+    )
     
     # If analysis data exists, show overall confidence and clarifying questions
     if st.session_state.get("analysis_data"):
         analysis_data = st.session_state["analysis_data"]
         overall_confidence = analysis_data.get("overall_confidence", 7.0)
-        if overall_confidence < 5:
-            conf_color = "#f25f5c"
-        elif overall_confidence < 7:
-            conf_color = "#ffaa00"
-        else:
-            conf_color = "#00fa92"
+        conf_color = _CONF_COLORS[bisect_right(_CONF_THRESHOLDS, overall_confidence)]
         st.sidebar.markdown(
-            f"<div style='font-size:1.1rem;'><strong>Overall Confidence:</strong> <span style='color:{conf_color};'>{overall_confidence:.1f} / 10</span></div>",
+            _CONFIDENCE_TPL.substitute(color=conf_color, score=f"{overall_confidence:.1f}"),
             unsafe_allow_html=True
         )
         
@@ -473,22 +1489,23 @@ def main():
                         clarifying_answers[f"q{i}"] = st.text_input(f"{i}) {question}", "")
                     reanalyze = st.form_submit_button("Submit Clarifications & Re-Analyze")
                 if reanalyze:
-                    with st.spinner("Re-analyzing with clarifications... (Estimated time: 45 seconds)"):
-                        new_clar_part = ""
-                        for i, question in enumerate(clarifying_questions, start=1):
-                            ans_text = clarifying_answers.get(f"q{i}", "").strip()
-                            if ans_text:
-                                new_clar_part += f"\n[QUESTION]: {question}\n[ANSWER]: {ans_text}\n"
+                    new_clar_part = ""
+                    for i, question in enumerate(clarifying_questions, start=1):
+                        ans_text = clarifying_answers.get(f"q{i}", "").strip()
+                        if ans_text:
+                            new_clar_part += f"\n[QUESTION]: {question}\n[ANSWER]: {ans_text}\n"
+                    # Blank answers leave the feature unchanged, so the current analysis still stands.
+                    if not new_clar_part:
+                        st.sidebar.info("Answer at least one question to re-analyze.")
+                    else:
                         # Append new clarifications to session state
                         st.session_state["clarifications"] += new_clar_part
-                        new_feature_data = {
-                            "feature_name": st.session_state["feature_name"],
-                            "industry": st.session_state["industry"],
-                            "business_goal": st.session_state["business_goal"],
-                            "business_model": st.session_state["business_model"],
-                            "context": "Detects fraudulent transactions in real time using advanced AI." + st.session_state["clarifications"]
-                        }
-                        st.session_state["analysis_data"] = generate_visual_analysis(new_feature_data)
+                        new_feature_data = session_feature_data()
+                        with st.spinner(f"Re-analyzing with clarifications... (Estimated time: {ANALYSIS_DEADLINE} seconds)"):
+                            st.session_state["analysis_data"] = generate_visual_analysis(
+                                new_feature_data, reanalysis_slot, semantic=False, model=st.session_state["gpt_model"]
+                            )
+                        st.session_state["analysis_key"] = _analysis_cache_key(new_feature_data, st.session_state["gpt_model"])
                         if st.session_state["analysis_data"]:
                             st.sidebar.success("Re-analysis completed with clarifications.")
                         else:
@@ -499,42 +1516,25 @@ def main():
     if st.sidebar.button("Reset Analysis"):
         reset_analysis()
     
-    st.sidebar.markdown("### Extra Features")
-    if st.sidebar.button("Export Analysis to PDF"):
-        st.sidebar.info("Export Analysis to PDF: Coming Soon!")
-    if st.sidebar.button("Collaboration Mode"):
-        st.sidebar.info("Collaboration Mode activated! Share your analysis with your team.")
-    feedback = st.sidebar.text_input("Feedback (Rate GPT's accuracy):", "")
-    if st.sidebar.button("Submit Feedback"):
-        st.sidebar.success("Feedback submitted. Thanks for your input!")
+    with st.sidebar:
+        render_extra_features()
     
     # -----------------------------------------------------------------------------
     # Main Form: Feature Configuration
     # -----------------------------------------------------------------------------
     if "feature_name" not in st.session_state:
-        st.session_state["feature_name"] = "AI-Powered Transaction Fraud Detection"
+        st.session_state["feature_name"] = _DEFAULT_FEATURE["feature_name"]
     if "industry_option" not in st.session_state:
-        st.session_state["industry_option"] = "FinTech"
+        st.session_state["industry_option"] = _DEFAULT_FEATURE["industry"]
     if "industry" not in st.session_state:
-        st.session_state["industry"] = "FinTech"
+        st.session_state["industry"] = _DEFAULT_FEATURE["industry"]
     if "business_goal" not in st.session_state:
-        st.session_state["business_goal"] = "Increase Revenue"
+        st.session_state["business_goal"] = _DEFAULT_FEATURE["business_goal"]
     if "business_model" not in st.session_state:
-        st.session_state["business_model"] = "B2B SaaS"
+        st.session_state["business_model"] = _DEFAULT_FEATURE["business_model"]
     
     st.markdown("<h1 style='color:#ea4335;'>🚀 FeatureFit: AI-Powered Feature Prioritization</h1>", unsafe_allow_html=True)
     
-    _business_models = [
-        "B2B SaaS", "B2C SaaS", "Marketplace", "Subscription-based service", "Freemium",
-        "Licensing", "On-premise software", "Advertising-based", "Pay-per-use",
-        "Commission-based", "Affiliate marketing", "Consulting-based",
-        "Peer-to-peer lending", "Crowdfunding", "Franchise model", "Direct sales",
-        "Manufacturing", "Dropshipping", "Aggregator", "Community-based",
-        "Data as a Service", "IoT-based", "Blockchain-based", "Open-source with support",
-        "Hybrid licensing model", "Usage-based analytics", "Microtransactions",
-        "In-app purchases", "Subscription box", "Government contracting"
-    ]
-    _industries = ["FinTech", "EdTech", "SaaS", "Healthcare", "E-commerce", "AI Tools", "Custom"]
     
     with st.form("analysis_form"):
         st.markdown("<h2 style='color:#4285f4;'>📌 Feature Configuration</h2>", unsafe_allow_html=True)
@@ -545,14 +1545,10 @@ def main():
                 st.session_state["feature_name"]
             )
         with col2:
-            try:
-                idx_ind = _industries.index(st.session_state["industry_option"])
-            except ValueError:
-                idx_ind = 0
             st.session_state["industry_option"] = st.selectbox(
                 "Industry *",
-                _industries,
-                index=idx_ind
+                _INDUSTRIES,
+                index=_INDUSTRY_INDEX.get(st.session_state["industry_option"], 0)
             )
             if st.session_state["industry_option"] == "Custom":
                 st.session_state["industry"] = st.text_input(
@@ -567,36 +1563,43 @@ def main():
             st.session_state["business_goal"]
         )
     
-        try:
-            idx_bm = _business_models.index(st.session_state["business_model"])
-        except ValueError:
-            idx_bm = 0
         st.session_state["business_model"] = st.selectbox(
             "Business Model",
-            _business_models,
-            index=idx_bm
+            _BUSINESS_MODELS,
+            index=_BUSINESS_MODEL_INDEX.get(st.session_state["business_model"], 0)
         )
     
-        base_context = "Detects fraudulent transactions in real time using advanced AI."
-        if st.session_state["clarifications"]:
-            base_context += "\n" + st.session_state["clarifications"]
-    
         st.session_state["context"] = st.text_area(
             "Additional Context",
-            base_context
+            _DEFAULT_FEATURE["context"]
         )
+        if st.session_state["clarifications"]:
+            st.caption("Your answers to the clarifying questions are sent along with this context.")
         submitted = st.form_submit_button("Analyze Feature")
+        force_refresh = st.form_submit_button("Force Refresh", help="Ignore cached results and re-run the analysis")
     
-    if submitted:
-        with st.spinner("Generating final analysis (takes up to 45 seconds)..."):
-            feature_data = {
-                "feature_name": st.session_state["feature_name"],
-                "industry": st.session_state["industry"],
-                "business_goal": st.session_state["business_goal"],
-                "business_model": st.session_state["business_model"],
-                "context": st.session_state["context"]
-            }
-            st.session_state["analysis_data"] = generate_visual_analysis(feature_data)
+    if submitted or force_refresh:
+        feature_data = session_feature_data()
+        model = st.session_state["gpt_model"]
+        feature_key = _analysis_cache_key(feature_data, model)
+        if force_refresh:
+            invalidate_cached_analysis(feature_data, model)
+            st.session_state["analysis_key"] = None
+        # Resubmitting unchanged inputs keeps the analysis already in this session.
+        if not (st.session_state["analysis_data"] and st.session_state["analysis_key"] == feature_key):
+            live_response = st.empty()
+            with st.spinner(f"Generating final analysis (takes up to {ANALYSIS_DEADLINE} seconds)..."):
+                st.session_state["analysis_data"] = generate_visual_analysis(
+                    feature_data, live_response, semantic=not force_refresh, model=model
+                )
+                st.session_state["analysis_key"] = feature_key
+            if not st.session_state["analysis_data"]:
+                st.error("The analysis failed or timed out. Please try again.")
+    
+    render_bulk_panel()
+    if ADMIN_MODE:
+        render_admin_panel()
+    render_bulk_results()
     
     if st.session_state.get("analysis_data"):
         display_analysis(st.session_state["analysis_data"])
@@ -610,41 +1613,6 @@ def main():
     # -----------------------------------------------------------------------------
     st.markdown(
         """
-        <style>
-        .float-btns {
-            position: fixed;
-            bottom: 20px;
-            right: 20px;
-            display: flex;
-            flex-direction: column;
-            gap: 8px;
-            z-index: 9999;
-        }
-        .float-btns a {
-            text-decoration: none;
-            font-size: 14px;
-            background: #4a5eab;
-            color: #fff;
-            padding: 8px 12px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.3);
-            transition: background 0.2s;
-        }
-        .float-btns a:hover {
-            background: #3c4b90;
-        }
-        @media screen and (max-width: 768px) {
-            .float-btns {
-                bottom: 90px;
-                right: 10px;
-                gap: 12px;
-                padding: 16px;
-            }
-            .float-btns .blogs-link {
-                display: none;
-            }
-        }
-        </style>
         <div class="float-btns">
             <a href="https://sabyasachimishra.dev" target="_blank">Portfolio</a>
             <a href="https://www.linkedin.com/in/sabyasachimishra007" target="_blank">LinkedIn</a>
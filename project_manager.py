@@ -1,7 +1,10 @@
 import json
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional
-from datetime import datetime
+from dataclasses import dataclass, asdict, field, fields
+from typing import List, Dict, Optional, Tuple
+from datetime import datetime, timezone
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
 
 @dataclass
 class Feature:
@@ -11,7 +14,7 @@ class Feature:
     business_goal: str
     business_model: str
     analysis_result: Optional[Dict] = None
-    created_at: str = datetime.now().isoformat()
+    created_at: str = field(default_factory=_utc_now)
 
 @dataclass
 class Project:
@@ -20,33 +23,43 @@ class Project:
     industry: str
     business_goals: str
     target_market: str
-    features: List[Feature] = None
-    created_at: str = datetime.now().isoformat()
-
-    def __post_init__(self):
-        if self.features is None:
-            self.features = []
+    created_at: str = field(default_factory=_utc_now)
+    # Features live behind the mutators so the name index can't drift: insertion id ->
+    # feature (dicts keep insertion order), plus name -> ids for O(1) lookup and removal.
+    _features: Dict[int, Feature] = field(default_factory=dict, init=False, repr=False)
+    _by_name: Dict[str, List[int]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _next_id: int = field(default=0, init=False, repr=False, compare=False)
+
+    @property
+    def features(self) -> Tuple[Feature, ...]:
+        """Read-only snapshot of the features, in the order they were added"""
+        return tuple(self._features.values())
 
     def add_feature(self, feature: Feature) -> None:
         """Add a new feature to the project"""
-        self.features.append(feature)
+        self._features[self._next_id] = feature
+        self._by_name.setdefault(feature.name, []).append(self._next_id)
+        self._next_id += 1
 
     def remove_feature(self, feature_name: str) -> bool:
         """Remove a feature from the project"""
-        initial_length = len(self.features)
-        self.features = [f for f in self.features if f.name != feature_name]
-        return len(self.features) < initial_length
+        ids = self._by_name.pop(feature_name, None)
+        if ids is None:
+            return False
+        for feature_id in ids:
+            del self._features[feature_id]
+        return True
 
     def get_feature(self, feature_name: str) -> Optional[Feature]:
-        """Get a feature by name"""
-        for feature in self.features:
-            if feature.name == feature_name:
-                return feature
-        return None
+        """Get a feature by name (the first one added, if names repeat)"""
+        ids = self._by_name.get(feature_name)
+        return self._features[ids[0]] if ids else None
 
     def to_dict(self) -> Dict:
         """Convert project to dictionary"""
-        return asdict(self)
+        data = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+        data["features"] = [asdict(feature) for feature in self._features.values()]
+        return data
 
 class ProjectManager:
     def __init__(self):
@@ -94,7 +107,7 @@ class ProjectManager:
     def get_project_features(self, project_name: str) -> List[Feature]:
         """Get all features for a project"""
         project = self.get_project(project_name)
-        return project.features if project else []
+        return list(project.features) if project else []
 
     def compare_features(self, project_name: str) -> List[Dict]:
         """Compare features in a project using RICE scores"""
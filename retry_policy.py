@@ -0,0 +1,12 @@
+# Backoff shared by featurefit.py and beta.py. Which errors are worth retrying differs
+# between the apps, so each keeps its own predicate next to its call sites.
+from tenacity import wait_exponential, wait_random
+
+
+def jittered_backoff(multiplier: float, max_wait: float):
+    """
+    Exponential backoff (multiplier * 2**attempt, capped at max_wait) plus up to 1s of jitter.
+    Spelled out rather than wait_exponential_jitter, whose keywords differ across the tenacity
+    versions requirements.txt allows.
+    """
+    return wait_exponential(multiplier=multiplier, max=max_wait) + wait_random(0, 1)
@@ -0,0 +1,57 @@
+import unittest
+
+from project_manager import Feature, Project, ProjectManager
+
+
+def _feature(name, description="d"):
+    return Feature(name, description, "FinTech", "Increase Revenue", "B2B SaaS")
+
+
+class ProjectFeatureIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.project = Project("p", "d", "FinTech", "Increase Revenue", "Banks")
+
+    def test_lookup_and_removal(self):
+        first, second = _feature("a"), _feature("b")
+        self.project.add_feature(first)
+        self.project.add_feature(second)
+        self.assertIs(self.project.get_feature("a"), first)
+        self.assertTrue(self.project.remove_feature("a"))
+        self.assertFalse(self.project.remove_feature("a"))
+        self.assertIsNone(self.project.get_feature("a"))
+        self.assertEqual(self.project.features, (second,))
+
+    def test_repeated_names_return_the_first_and_remove_all(self):
+        first = _feature("a", "first")
+        self.project.add_feature(first)
+        self.project.add_feature(_feature("a", "second"))
+        self.assertIs(self.project.get_feature("a"), first)
+        self.assertTrue(self.project.remove_feature("a"))
+        self.assertEqual(self.project.features, ())
+
+    def test_features_cannot_be_edited_behind_the_index(self):
+        self.project.add_feature(_feature("f0"))
+        with self.assertRaises(TypeError):
+            self.project.features[0] = _feature("new")
+        with self.assertRaises(AttributeError):
+            self.project.features = [_feature("new")]
+        self.assertEqual(self.project.get_feature("f0").name, "f0")
+        self.assertIsNone(self.project.get_feature("new"))
+
+    def test_manager_hands_out_a_copy(self):
+        manager = ProjectManager()
+        project = manager.create_project("p", "d", "FinTech", "Increase Revenue", "Banks")
+        manager.add_feature_to_project("p", _feature("f0"))
+        manager.get_project_features("p").append(_feature("new"))
+        self.assertEqual([f.name for f in project.features], ["f0"])
+        self.assertIsNone(project.get_feature("new"))
+
+    def test_to_dict_lists_features_without_the_index(self):
+        self.project.add_feature(_feature("a"))
+        data = self.project.to_dict()
+        self.assertEqual([f["name"] for f in data["features"]], ["a"])
+        self.assertFalse(any(key.startswith("_") for key in data))
+
+
+if __name__ == "__main__":
+    unittest.main()
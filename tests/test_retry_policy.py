@@ -0,0 +1,115 @@
+import asyncio
+import logging
+import unittest
+
+import httpx
+from openai import APIStatusError, RateLimitError
+
+# With a root handler in place the apps skip attaching their rotating log files.
+logging.getLogger().addHandler(logging.NullHandler())
+
+import beta  # noqa: E402
+import featurefit  # noqa: E402
+
+_REQUEST = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+def _rate_limit(retry_after=None):
+    headers = {"retry-after": retry_after} if retry_after is not None else {}
+    return RateLimitError("rate limited", response=httpx.Response(429, headers=headers, request=_REQUEST), body=None)
+
+
+def _status(code):
+    return APIStatusError("status %s" % code, response=httpx.Response(code, request=_REQUEST), body=None)
+
+
+class _Completions:
+    """Raises each queued exception in turn, then returns "ok"."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def _next(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+    async def parse(self, **kwargs):
+        return self._next()
+
+    def create(self, **kwargs):
+        return self._next()
+
+
+class _AsyncCompletions(_Completions):
+    async def create(self, **kwargs):
+        return self._next()
+
+
+class _Client:
+    def __init__(self, completions):
+        self.chat = self
+        self.beta = self
+        self.completions = completions
+
+
+class FeatureFitRetryTest(unittest.TestCase):
+    def _run(self, completions):
+        sleeps = []
+
+        async def sleep(seconds):
+            sleeps.append(seconds)
+
+        call = featurefit._aparse_completion.retry_with(sleep=sleep)
+        return asyncio.run(call(_Client(completions), model="m")), sleeps
+
+    def test_honours_retry_after_then_backs_off(self):
+        completions = _Completions(_rate_limit("0.2"), _status(503))
+        result, sleeps = self._run(completions)
+        self.assertEqual(result, "ok")
+        self.assertEqual(completions.calls, 3)
+        self.assertEqual(sleeps[0], 0.2)
+        # Second attempt: 1 * 2**1 seconds plus up to 1s of jitter.
+        self.assertGreaterEqual(sleeps[1], 2)
+        self.assertLessEqual(sleeps[1], 3)
+
+    def test_client_errors_are_not_retried(self):
+        completions = _Completions(_status(400))
+        with self.assertRaises(APIStatusError):
+            self._run(completions)
+        self.assertEqual(completions.calls, 1)
+
+    def test_gives_up_after_four_attempts(self):
+        completions = _Completions(*[_status(500) for _ in range(4)])
+        with self.assertRaises(APIStatusError):
+            self._run(completions)
+        self.assertEqual(completions.calls, 4)
+
+
+class BetaRetryTest(unittest.TestCase):
+    def test_backs_off_exponentially_with_jitter(self):
+        sleeps = []
+        completions = _Completions(_rate_limit(), _rate_limit(), _rate_limit())
+        call = beta._call_openai.retry_with(sleep=sleeps.append)
+        self.assertEqual(call(_Client(completions), model="m"), "ok")
+        self.assertEqual(completions.calls, 4)
+        for seconds, base in zip(sleeps, (0.5, 1, 2)):
+            self.assertGreaterEqual(seconds, base)
+            self.assertLessEqual(seconds, base + 1)
+
+    def test_async_call_sites_share_the_policy(self):
+        sleeps = []
+
+        async def sleep(seconds):
+            sleeps.append(seconds)
+
+        completions = _AsyncCompletions(_rate_limit())
+        call = beta._acall_openai.retry_with(sleep=sleep)
+        self.assertEqual(asyncio.run(call(_Client(completions), model="m")), "ok")
+        self.assertEqual(len(sleeps), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()